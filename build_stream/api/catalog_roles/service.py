@@ -20,6 +20,8 @@ import logging
 import zipfile
 from typing import Dict, List
 
+import orjson
+
 from core.artifacts.exceptions import ArtifactNotFoundError
 from core.artifacts.interfaces import ArtifactMetadataRepository, ArtifactStore
 from core.artifacts.value_objects import ArtifactKind
@@ -187,8 +189,9 @@ class CatalogRolesService:
                     "Reading roles from archive entry: %s (job=%s)", target, job_id
                 )
 
-                with zf.open(target) as f:
-                    data = json.load(f)
+                # orjson parses the raw bytes in one pass; its
+                # JSONDecodeError subclasses json.JSONDecodeError.
+                data = orjson.loads(zf.read(target))
 
         except zipfile.BadZipFile as exc:
             logger.error(
@@ -302,8 +305,8 @@ class CatalogRolesService:
             ) from exc
 
         try:
-            catalog_data = json.loads(catalog_bytes.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            catalog_data = orjson.loads(catalog_bytes)
+        except json.JSONDecodeError as exc:
             logger.error(
                 "Failed to parse catalog file for job %s", job_id
             )
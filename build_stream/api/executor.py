@@ -0,0 +1,74 @@
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Shared executor for blocking stage work started from async routes.
+
+Stage use cases (catalog parsing, input-file generation, build image) are
+synchronous and do file and CPU heavy work. Routes hand them to one
+process-wide, bounded thread pool so a burst of requests queues on a fixed
+set of workers instead of blocking the event loop or growing without limit.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+STAGE_EXECUTOR_WORKERS = int(
+    os.getenv("STAGE_EXECUTOR_WORKERS", str(min(32, (os.cpu_count() or 1) + 4)))
+)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_stage_executor() -> ThreadPoolExecutor:
+    """Return the shared stage executor, creating it on first use."""
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=STAGE_EXECUTOR_WORKERS,
+                thread_name_prefix="stage-worker",
+            )
+            logger.info(
+                "Started stage executor with %d workers", STAGE_EXECUTOR_WORKERS
+            )
+        return _executor
+
+
+async def run_stage_task(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable on the shared stage executor and await it."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_stage_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_stage_executor() -> None:
+    """Wait for queued stage work to finish and release the workers."""
+    global _executor  # pylint: disable=global-statement
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
+        logger.info("Stage executor stopped")
@@ -19,6 +19,7 @@ from typing import Annotated, Optional
 
 from fastapi import APIRouter, Body, Depends, HTTPException, status
 
+from api.executor import run_stage_task
 from api.dependencies import require_catalog_read, verify_token, mark_stage_as_failed, get_db_session
 from api.generate_input_files.dependencies import get_generate_input_files_use_case
 from api.logging_utils import log_secure_info
@@ -125,7 +126,8 @@ async def generate_input_files(
     )
 
     try:
-        result = use_case.execute(command)
+        # Config generation is blocking file and CPU work; keep it off the event loop.
+        result = await run_stage_task(use_case.execute, command)
         log_secure_info(
             "debug",
             f"Generate-input-files executing: job_id={job_id}, "
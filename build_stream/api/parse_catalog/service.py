@@ -14,7 +14,6 @@
 
 """Business logic service for ParseCatalog API."""
 
-import json
 import logging
 import os
 import tempfile
@@ -22,7 +21,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from core.catalog.generator import generate_root_json_from_catalog
+from api.executor import run_stage_task
 from common.config import load_config
 from core.jobs.value_objects import CorrelationId, JobId
 from infra.id_generator import UUIDv4Generator
@@ -104,21 +106,23 @@ class ParseCatalogService:  # pylint: disable=too-few-public-methods
         json_data = self._parse_json_content(contents)
         self._validate_json_structure(json_data)
 
-        return await self._process_catalog_via_orchestrator(json_data, job_id)
+        return await self._process_catalog_via_orchestrator(contents, job_id)
+
+    async def _process_catalog_via_orchestrator(self, contents: bytes, job_id: str) -> ParseResult:
+        """Process catalog using the orchestrator use case.
 
-    async def _process_catalog_via_orchestrator(self, json_data: dict, job_id: str) -> ParseResult:
-        """Process catalog using the orchestrator use case."""
+        The uploaded bytes are handed to the orchestrator as-is; they have
+        already been validated, so re-serializing the parsed document would
+        only add another full in-memory copy of the catalog.
+        """
         # Create command for orchestrator
         uuid_gen = UUIDv4Generator()
 
-        # Convert json_data back to bytes as expected by orchestrator
-        json_bytes = json.dumps(json_data).encode('utf-8')
-
         command = ParseCatalogCommand(
             job_id=JobId(job_id),
             correlation_id=CorrelationId(str(uuid_gen.generate())),
             filename="uploaded.json",
-            content=json_bytes,
+            content=contents,
         )
 
         # Execute via orchestrator use case (injected, not from container)
@@ -128,8 +132,10 @@ class ParseCatalogService:  # pylint: disable=too-few-public-methods
             use_case = container.parse_catalog_use_case()
         else:
             use_case = self.parse_catalog_use_case
-            
-        result = use_case.execute(command)
+
+        # Root JSON generation is blocking file and CPU work; run it on the
+        # shared stage executor so the event loop keeps serving requests.
+        result = await run_stage_task(use_case.execute, command)
 
         # Convert orchestrator result to API result
         return ParseResult(
@@ -148,8 +154,8 @@ class ParseCatalogService:  # pylint: disable=too-few-public-methods
     def _parse_json_content(self, contents: bytes) -> dict:
         """Parse JSON content from bytes."""
         try:
-            return json.loads(contents.decode("utf-8"))
-        except json.JSONDecodeError as e:
+            return orjson.loads(contents.decode("utf-8"))
+        except orjson.JSONDecodeError as e:
             logger.error("Failed to parse JSON content")
             raise InvalidJSONError(f"Invalid JSON data: {e.msg}") from e
         except UnicodeDecodeError as e:
@@ -213,10 +219,9 @@ class ParseCatalogService:  # pylint: disable=too-few-public-methods
             Path to the temporary file.
         """
         with tempfile.NamedTemporaryFile(
-            mode="w",
+            mode="wb",
             suffix=".json",
             delete=False,
-            encoding="utf-8",
         ) as f:
-            json.dump(json_data, f)
+            f.write(orjson.dumps(json_data))
             return f.name
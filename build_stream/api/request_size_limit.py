@@ -0,0 +1,117 @@
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""ASGI middleware that rejects request bodies above a size limit.
+
+Oversized requests are answered with 413 as soon as the limit is known to be
+exceeded: up front from Content-Length, or while the body is being received,
+so the upload is never fully spooled or parsed.
+"""
+
+import logging
+
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Allowance for multipart boundaries, part headers and form fields sent
+# alongside an uploaded file.
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024  # 1 MiB
+
+
+def _too_large_detail(max_body_size: int) -> dict:
+    return {
+        "error_code": "REQUEST_TOO_LARGE",
+        "message": (
+            f"Request body exceeds the maximum allowed size of {max_body_size} bytes."
+        ),
+    }
+
+
+class _BodyTooLargeError(HTTPException):
+    """Raised from receive() once the streamed body crosses the limit.
+
+    Being an HTTPException, it is re-raised by FastAPI's body parsing and
+    rendered as a 413 by the normal exception handling.
+    """
+
+    def __init__(self, max_body_size: int) -> None:
+        super().__init__(status_code=413, detail=_too_large_detail(max_body_size))
+
+
+class RequestSizeLimitMiddleware:  # pylint: disable=too-few-public-methods
+    """Reject HTTP requests whose body is larger than max_body_size bytes."""
+
+    def __init__(self, app: ASGIApp, max_body_size: int) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope.get("headers", [])).get(b"content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.max_body_size:
+                await self._reject(scope, receive, send)
+                return
+
+        received = 0
+        response_started = False
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    logger.warning(
+                        "Rejected request to %s: body exceeds %d bytes",
+                        scope.get("path", ""),
+                        self.max_body_size,
+                    )
+                    raise _BodyTooLargeError(self.max_body_size)
+            return message
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, tracking_send)
+        except _BodyTooLargeError:
+            if response_started:
+                raise
+            await self._send_too_large(scope, receive, send)
+
+    async def _reject(self, scope: Scope, receive: Receive, send: Send) -> None:
+        logger.warning(
+            "Rejected request to %s: Content-Length exceeds %d bytes",
+            scope.get("path", ""),
+            self.max_body_size,
+        )
+        await self._send_too_large(scope, receive, send)
+
+    async def _send_too_large(self, scope: Scope, receive: Receive, send: Send) -> None:
+        response = JSONResponse(
+            status_code=413,
+            content={"detail": _too_large_detail(self.max_body_size)},
+        )
+        await response(scope, receive, send)
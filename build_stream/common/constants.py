@@ -11,3 +11,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+
+"""Constants shared by the API and orchestrator layers."""
+
+# Largest catalog file accepted for parsing.
+MAX_CATALOG_SIZE_BYTES = 5 * 1024 * 1024  # 5 MB
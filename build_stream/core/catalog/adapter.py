@@ -19,7 +19,11 @@ Transforms generated feature-list JSONs into omnia configuration JSONs.
 
 import json
 import os
+import re
 from collections import Counter
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Iterable, List, Tuple, Optional
 import argparse
 import logging
@@ -51,29 +55,49 @@ _DEFAULT_SCHEMA_PATH = os.path.join(_BASE_DIR, "resources", "CatalogSchema.json"
 ERROR_CODE_INPUT_NOT_FOUND = 2
 ERROR_CODE_PROCESSING_ERROR = 3
 
+# Upper bound on concurrent file writes per output directory.
+_MAX_WRITE_WORKERS = 8
+
 
 def _snake_case(name: str) -> str:
     return name.strip().lower().replace(" ", "_")
 
 
-def _package_key(pkg: Package) -> Tuple[str, str, str]:
-    """Key used to detect common packages across features.
+# Key used to detect common packages across features: (package, type,
+# repo_name), which distinguishes identical names in different repos/types.
+_package_key = attrgetter("package", "type", "repo_name")
+
+# Reused encoder for the one-line package entries in written config files.
+_encode_pkg = json.JSONEncoder(separators=(", ", ": ")).encode
+
+
+def _feature_keys(pkgs: List[Package]) -> List[Tuple[str, str, str]]:
+    """Return the _package_key of every package, parallel to ``pkgs``."""
+    return list(map(_package_key, pkgs))
 
-    Uses (package, type, repo_name) to distinguish identical names in different repos/types.
-    """
-    return (pkg.package, pkg.type, pkg.repo_name)
 
+# Per-combination cache of converted packages, keyed by id(Package). Only
+# valid while the FeatureLists holding those packages are alive.
+PackageDictCache = Dict[int, Dict[str, str]]
 
-def _package_to_dict(pkg: Package) -> Dict[str, str]:
+
+def _package_to_dict(pkg: Package, cache: Optional[PackageDictCache] = None) -> Dict[str, str]:
     # Adapter-specific wrapper over the shared helper; note that the
     # adapter JSONs intentionally do not include architecture.
-    return _package_common_dict(pkg)  # type: ignore[return-value]
+    if cache is None:
+        return _package_common_dict(pkg)  # type: ignore[return-value]
+    pkg_dict = cache.get(id(pkg))
+    if pkg_dict is None:
+        pkg_dict = cache[id(pkg)] = _package_common_dict(pkg)  # type: ignore[assignment]
+    return pkg_dict
 
 
 # -------------------------- Base OS / default packages --------------------------
 
 
-def build_default_packages_config(base_os: FeatureList) -> Dict:
+def build_default_packages_config(
+    base_os: FeatureList, cache: Optional[PackageDictCache] = None
+) -> Dict:
     """Build default_packages.json-style structure from Base OS FeatureList.
 
     Expected FeatureList has a feature named "Base OS".
@@ -82,57 +106,116 @@ def build_default_packages_config(base_os: FeatureList) -> Dict:
     if feature is None:
         raise ValueError("Base OS feature not found in base_os FeatureList")
 
-    cluster = [_package_to_dict(pkg) for pkg in feature.packages]
+    cluster = [_package_to_dict(pkg, cache) for pkg in feature.packages]
     logger.info("Built default_packages config with %d package(s)", len(cluster))
     return {"default_packages": {"cluster": cluster}}
 
 
+@lru_cache(maxsize=64)
+def _substring_matcher(substrings: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile a case-folded alternation matching any of substrings.
+
+    One pattern scans each name once for all substrings, in the C regex
+    engine. Returns None when there are no substrings (nothing matches).
+    """
+    lowered = [s.lower() for s in substrings]
+    return re.compile("|".join(map(re.escape, lowered))) if lowered else None
+
+
 def _build_subconfig_from_base_os(
-    base_os: FeatureList, name: str, substrings: Iterable[str]
+    base_os: FeatureList,
+    name: str,
+    substrings: Iterable[str],
+    cache: Optional[PackageDictCache] = None,
+    lowered_names: Optional[List[str]] = None,
 ) -> Dict | None:
     """Generic helper to build nfs/openldap/openmpi-style configs.
 
     Selects packages from Base OS whose package name contains any of the substrings.
-    Returns None if no packages match.
+    Returns None if no packages match. lowered_names, if given, holds the
+    lower-cased Base OS package names in package order.
     """
     feature: Feature | None = base_os.features.get("Base OS")
     if feature is None:
         return None
 
-    lowered = [s.lower() for s in substrings]
-    selected = [
-        pkg
-        for pkg in feature.packages
-        if any(sub in pkg.package.lower() for sub in lowered)
-    ]
+    if lowered_names is None:
+        lowered_names = [pkg.package.lower() for pkg in feature.packages]
+    substrings = tuple(substrings)
+    matcher = _substring_matcher(substrings)
+    selected = (
+        [
+            pkg
+            for pkg, pkg_name in zip(feature.packages, lowered_names)
+            if matcher.search(pkg_name)
+        ]
+        if matcher is not None
+        else []
+    )
     if not selected:
         logger.info("No %s packages found in Base OS for substrings %s", name, list(substrings))
         return None
 
-    cluster = [_package_to_dict(pkg) for pkg in selected]
+    cluster = [_package_to_dict(pkg, cache) for pkg in selected]
     logger.info("Built %s config with %d package(s)", name, len(cluster))
     return {name: {"cluster": cluster}}
 
 
+# Base OS subset configs: config name -> (filename, name substrings).
+_BASE_OS_SUBCONFIGS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "nfs": ("nfs.json", ("nfs",)),
+    "openldap": ("openldap.json", ("ldap",)),
+    "openmpi": ("openmpi.json", ("openmpi",)),
+}
+
+
 def build_nfs_config(base_os: FeatureList) -> Dict | None:
     """Build nfs config from Base OS FeatureList."""
-    return _build_subconfig_from_base_os(base_os, "nfs", ["nfs"])
+    return _build_subconfig_from_base_os(base_os, "nfs", _BASE_OS_SUBCONFIGS["nfs"][1])
 
 
 def build_openldap_config(base_os: FeatureList) -> Dict | None:
     """Build openldap config from Base OS FeatureList."""
-    return _build_subconfig_from_base_os(base_os, "openldap", ["ldap"])
+    return _build_subconfig_from_base_os(
+        base_os, "openldap", _BASE_OS_SUBCONFIGS["openldap"][1]
+    )
 
 
 def build_openmpi_config(base_os: FeatureList) -> Dict | None:
     """Build openmpi config from Base OS FeatureList."""
-    return _build_subconfig_from_base_os(base_os, "openmpi", ["openmpi"])
+    return _build_subconfig_from_base_os(
+        base_os, "openmpi", _BASE_OS_SUBCONFIGS["openmpi"][1]
+    )
+
+
+def build_base_os_subconfigs(
+    base_os: FeatureList, cache: Optional[PackageDictCache] = None
+) -> Dict[str, Dict]:
+    """Build the nfs/openldap/openmpi configs, lower-casing package names once.
+
+    Returns a mapping of filename -> JSON dict for the configs that matched.
+    """
+    feature: Feature | None = base_os.features.get("Base OS")
+    if feature is None:
+        return {}
+
+    lowered_names = [pkg.package.lower() for pkg in feature.packages]
+    configs: Dict[str, Dict] = {}
+    for name, (filename, substrings) in _BASE_OS_SUBCONFIGS.items():
+        cfg = _build_subconfig_from_base_os(
+            base_os, name, substrings, cache, lowered_names
+        )
+        if cfg:
+            configs[filename] = cfg
+    return configs
 
 
 # -------------------------- K8s services from functional layer --------------------------
 
 
-def build_service_k8s_config(functional: FeatureList) -> Dict:
+def build_service_k8s_config(
+    functional: FeatureList, cache: Optional[PackageDictCache] = None
+) -> Dict:
     """Build service_k8s.json-like structure from functional FeatureList.
 
     Uses feature names "K8S Controller" and "K8S Worker" if present.
@@ -147,22 +230,23 @@ def build_service_k8s_config(functional: FeatureList) -> Dict:
 
     ctrl_pkgs = controller.packages
     node_pkgs = worker.packages
+    node_keys_arr = _feature_keys(node_pkgs)
+    node_key_set = set(node_keys_arr)
 
-    ctrl_keys = {_package_key(p) for p in ctrl_pkgs}
-    node_keys = {_package_key(p) for p in node_pkgs}
-    common_keys = ctrl_keys & node_keys
-
-    def _filter(pkgs: List[Package], exclude: set[Tuple[str, str, str]]) -> List[Package]:
-        return [p for p in pkgs if _package_key(p) not in exclude]
-
-    # Keep order, but only one instance of each common key
-    seen_common: set[Tuple[str, str, str]] = set()
+    # Single pass over the controller: a package is common when the worker
+    # also has its key. Keep order, but only one instance of each common key.
+    common_keys: set[Tuple[str, str, str]] = set()
     common_pkgs: List[Package] = []
-    for pkg in ctrl_pkgs + node_pkgs:
-        k = _package_key(pkg)
-        if k in common_keys and k not in seen_common:
-            seen_common.add(k)
-            common_pkgs.append(pkg)
+    ctrl_only: List[Package] = []
+    for pkg, k in zip(ctrl_pkgs, _feature_keys(ctrl_pkgs)):
+        if k in node_key_set:
+            if k not in common_keys:
+                common_keys.add(k)
+                common_pkgs.append(pkg)
+        else:
+            ctrl_only.append(pkg)
+
+    node_only = [p for p, k in zip(node_pkgs, node_keys_arr) if k not in common_keys]
 
     logger.info(
         "Built service_k8s config: %d controller pkg(s), %d worker pkg(s), %d common pkg(s)",
@@ -173,19 +257,21 @@ def build_service_k8s_config(functional: FeatureList) -> Dict:
 
     return {
         "service_kube_control_plane": {
-            "cluster": [_package_to_dict(p) for p in _filter(ctrl_pkgs, common_keys)]
+            "cluster": [_package_to_dict(p, cache) for p in ctrl_only]
         },
         "service_kube_node": {
-            "cluster": [_package_to_dict(p) for p in _filter(node_pkgs, common_keys)]
+            "cluster": [_package_to_dict(p, cache) for p in node_only]
         },
-        "service_k8s": {"cluster": [_package_to_dict(p) for p in common_pkgs]},
+        "service_k8s": {"cluster": [_package_to_dict(p, cache) for p in common_pkgs]},
     }
 
 
 # -------------------------- Slurm custom from functional layer --------------------------
 
 
-def build_slurm_custom_config(functional: FeatureList) -> Dict:
+def build_slurm_custom_config(
+    functional: FeatureList, cache: Optional[PackageDictCache] = None
+) -> Dict:
     """Build slurm_custom.json-style structure from functional FeatureList.
 
     Nodes used:
@@ -215,15 +301,17 @@ def build_slurm_custom_config(functional: FeatureList) -> Dict:
     # Count how many nodes each package appears in
     key_counts: Counter[Tuple[str, str, str]] = Counter()
     key_to_pkg: Dict[Tuple[str, str, str], Package] = {}
+    node_keys: Dict[str, List[Tuple[str, str, str]]] = {}
 
-    for feature in node_features.values():
-        seen_in_this_node: set[Tuple[str, str, str]] = set()
-        for pkg in feature.packages:
-            k = _package_key(pkg)
-            key_to_pkg.setdefault(k, pkg)
-            if k not in seen_in_this_node:
-                seen_in_this_node.add(k)
-                key_counts[k] += 1
+    for node_name, feature in node_features.items():
+        keys = node_keys[node_name] = _feature_keys(feature.packages)
+        # Unique keys in first-seen order, and the first package for each key
+        # (zipping in reverse lets earlier packages overwrite later ones).
+        unique_keys = dict.fromkeys(keys).keys()
+        first_pkg = dict(zip(reversed(keys), reversed(feature.packages)))
+        key_counts.update(unique_keys)
+        for k in unique_keys:
+            key_to_pkg.setdefault(k, first_pkg[k])
 
     common_keys = {k for k, count in key_counts.items() if count >= 2}
 
@@ -231,9 +319,9 @@ def build_slurm_custom_config(functional: FeatureList) -> Dict:
     output: Dict[str, Dict] = {}
     for node_name, feature in node_features.items():
         filtered_pkgs = [
-            _package_to_dict(pkg)
-            for pkg in feature.packages
-            if _package_key(pkg) not in common_keys
+            _package_to_dict(pkg, cache)
+            for pkg, k in zip(feature.packages, node_keys[node_name])
+            if k not in common_keys
         ]
         output[node_name] = {"cluster": filtered_pkgs}
 
@@ -241,7 +329,7 @@ def build_slurm_custom_config(functional: FeatureList) -> Dict:
     common_pkg_dicts: List[Dict[str, str]] = []
     for k, pkg in key_to_pkg.items():
         if k in common_keys:
-            common_pkg_dicts.append(_package_to_dict(pkg))
+            common_pkg_dicts.append(_package_to_dict(pkg, cache))
 
     output["slurm_custom"] = {"cluster": common_pkg_dicts}
 
@@ -257,7 +345,9 @@ def build_slurm_custom_config(functional: FeatureList) -> Dict:
 # -------------------------- Infrastructure splitting --------------------------
 
 
-def build_infra_configs(infra: FeatureList) -> Dict[str, Dict]:
+def build_infra_configs(
+    infra: FeatureList, cache: Optional[PackageDictCache] = None
+) -> Dict[str, Dict]:
     """Split infrastructure FeatureList into separate config-style JSON structures.
 
     Returns a mapping of filename -> JSON dict. Filenames and top-level keys are
@@ -276,7 +366,7 @@ def build_infra_configs(infra: FeatureList) -> Dict[str, Dict]:
             file_name = f"{name_snake}.json"
             top_key = name_snake
 
-        cluster = [_package_to_dict(pkg) for pkg in feature.packages]
+        cluster = [_package_to_dict(pkg, cache) for pkg in feature.packages]
         configs[file_name] = {top_key: {"cluster": cluster}}
 
     logger.info("Built %d infrastructure config file(s)", len(configs))
@@ -287,41 +377,94 @@ def build_infra_configs(infra: FeatureList) -> Dict[str, Dict]:
 # -------------------------- Utility: write configs to disk --------------------------
 
 
+def _render_config(data: Dict) -> str:
+    """Render one config dict in the adapter's one-package-per-line layout."""
+    # Expect shape: { top_key: { "cluster": [pkg_dicts...] } }
+    sections = []
+    for top_key, body in data.items():
+        pkg_lines = ",\n".join(
+            "      " + _encode_pkg(pkg) for pkg in body.get("cluster", [])
+        )
+        sections.append(
+            f"  {_encode_pkg(top_key)}: {{\n"
+            "    \"cluster\": [\n"
+            + (pkg_lines + "\n" if pkg_lines else "")
+            + "    ]\n"
+            "  }"
+        )
+    return "{\n" + ",\n".join(sections) + ("\n" if sections else "") + "}\n"
+
+
 def write_config_files(configs: Dict[str, Dict], output_dir: str) -> None:
     """Write multiple config JSONs into an output directory.
 
     - configs: mapping of filename -> JSON-serializable dict
     - output_dir: directory under which files will be written
+
+    Each file is rendered in memory and written with a single call; files
+    are written concurrently on a small thread pool.
     """
     os.makedirs(output_dir, exist_ok=True)
     logger.info("Writing %d config file(s) to %s", len(configs), output_dir)
-    for filename, data in configs.items():
+
+    def _write_one(item: Tuple[str, Dict]) -> None:
+        filename, data = item
         path = os.path.join(output_dir, filename)
         logger.debug("Writing config file %s", path)
         with open(path, "w", encoding="utf-8") as out_file:
-            # Expect shape: { top_key: { "cluster": [pkg_dicts...] } }
-            out_file.write("{\n")
+            out_file.write(_render_config(data))
+
+    if len(configs) <= 1:
+        for item in configs.items():
+            _write_one(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(configs))) as executor:
+        list(executor.map(_write_one, configs.items()))
+
+
+def _build_and_write_one(
+    arch: str,
+    os_name: str,
+    version: str,
+    functional_arch: FeatureList,
+    infra_arch: FeatureList,
+    base_os_arch: FeatureList,
+    misc_arch: FeatureList,
+    output_root: str,
+) -> None:
+    """Build and write the config-style JSONs for one (arch, os, version).
+
+    The FeatureLists passed in must already be filtered for ``arch``.
+    """
+    logger.info(
+        "Building configs for arch=%s os=%s version=%s", arch, os_name, version
+    )
+
+    configs: Dict[str, Dict] = {}
+    # Base OS packages feed several builders; convert each one only once.
+    cache: PackageDictCache = {}
+
+    configs["default_packages.json"] = build_default_packages_config(base_os_arch, cache)
 
-            items = list(data.items())
-            for i, (top_key, body) in enumerate(items):
-                out_file.write(f"  {json.dumps(top_key)}: {{\n")
-                out_file.write("    \"cluster\": [\n")
+    configs.update(build_base_os_subconfigs(base_os_arch, cache))
 
-                pkgs = body.get("cluster", [])
-                for j, pkg in enumerate(pkgs):
-                    line = "      " + json.dumps(pkg, separators=(", ", ": "))
-                    if j < len(pkgs) - 1:
-                        line += ","
-                    out_file.write(line + "\n")
+    configs["service_k8s.json"] = build_service_k8s_config(functional_arch, cache)
+    configs["slurm_custom.json"] = build_slurm_custom_config(functional_arch, cache)
 
-                out_file.write("    ]\n")
-                out_file.write("  }")
-                if i < len(items) - 1:
-                    out_file.write(",\n")
-                else:
-                    out_file.write("\n")
+    misc_feature: Feature | None = misc_arch.features.get("Miscellaneous")
+    if misc_feature is not None and misc_feature.packages:
+        configs["miscellaneous.json"] = {
+            "miscellaneous": {
+                "cluster": [_package_to_dict(p, cache) for p in misc_feature.packages]
+            }
+        }
+
+    infra_configs = build_infra_configs(infra_arch, cache)
+    configs.update(infra_configs)
 
-            out_file.write("}\n")
+    output_dir = os.path.join(output_root, arch, os_name, version)
+    write_config_files(configs, output_dir)
 
 
 def generate_all_configs(
@@ -352,45 +495,20 @@ def generate_all_configs(
 
     combos = _discover_arch_os_version_from_catalog(catalog)
     logger.info("Generating adapter configs for %d combination(s)", len(combos))
-    for arch, os_name, version in combos:
-        functional_arch = _filter_featurelist_for_arch(functional, arch)
-        base_os_arch = _filter_featurelist_for_arch(base_os, arch)
-        infra_arch = _filter_featurelist_for_arch(infra, arch)
-        misc_arch = _filter_featurelist_for_arch(misc, arch)
-
-        logger.info(
-            "Building configs for arch=%s os=%s version=%s", arch, os_name, version
-        )
-
-        configs: Dict[str, Dict] = {}
-
-        configs["default_packages.json"] = build_default_packages_config(base_os_arch)
-
-        for filename, builder in (
-            ("nfs.json", build_nfs_config),
-            ("openldap.json", build_openldap_config),
-            ("openmpi.json", build_openmpi_config),
-        ):
-            cfg = builder(base_os_arch)
-            if cfg:
-                configs[filename] = cfg
 
-        configs["service_k8s.json"] = build_service_k8s_config(functional_arch)
-        configs["slurm_custom.json"] = build_slurm_custom_config(functional_arch)
+    # The arch filter does not depend on os/version, so run it once per arch.
+    filtered: Dict[str, Tuple[FeatureList, FeatureList, FeatureList, FeatureList]] = {}
+    for arch, _, _ in combos:
+        if arch not in filtered:
+            filtered[arch] = (
+                _filter_featurelist_for_arch(functional, arch),
+                _filter_featurelist_for_arch(infra, arch),
+                _filter_featurelist_for_arch(base_os, arch),
+                _filter_featurelist_for_arch(misc, arch),
+            )
 
-        misc_feature: Feature | None = misc_arch.features.get("Miscellaneous")
-        if misc_feature is not None and misc_feature.packages:
-            configs["miscellaneous.json"] = {
-                "miscellaneous": {
-                    "cluster": [_package_to_dict(p) for p in misc_feature.packages]
-                }
-            }
-
-        infra_configs = build_infra_configs(infra_arch)
-        configs.update(infra_configs)
-
-        output_dir = os.path.join(output_root, arch, os_name, version)
-        write_config_files(configs, output_dir)
+    for arch, os_name, version in combos:
+        _build_and_write_one(arch, os_name, version, *filtered[arch], output_root)
 
 
 def generate_omnia_json_from_catalog(
@@ -22,15 +22,26 @@ import json
 import os
 import argparse
 import logging
+import re
 import shutil
-from typing import Dict, List, Any, Optional, Tuple
-from collections import Counter
+from typing import Callable, Dict, FrozenSet, Iterable, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import product
 
+import orjson
 import yaml
 
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.protocols import Validator
 
-from .utils import _configure_logging, load_json_file
+from .utils import (
+    _configure_logging,
+    get_schema_validator,
+    load_json_file,
+    load_schema_validator,
+    validate_with_validator,
+)
 from . import adapter_policy_schema_consts as schema
 
 logger = logging.getLogger(__name__)
@@ -42,6 +53,12 @@ _DEFAULT_SCHEMA_PATH = os.path.join(_BASE_DIR, "resources", "AdapterPolicySchema
 _K8S_VERSION = "1.34.1"
 _CSI_VERSION = "v2.15.0"
 
+# Reused encoder for the one-package-per-line config layout.
+_encode_pkg = json.JSONEncoder(separators=(", ", ": ")).encode
+
+# Upper bound on threads used to read source JSONs for one partition.
+_MAX_LOAD_WORKERS = 8
+
 
 def _validate_input_policy_and_schema_paths(
     input_dir: str,
@@ -61,8 +78,13 @@ def _validate_input_policy_and_schema_paths(
 
 def validate_policy_config(policy_config: Any, schema_config: Any, policy_path: str, schema_path: str) -> None:
     """Validate the adapter policy JSON against the schema."""
+    _validate_policy_with(policy_config, get_schema_validator(schema_config), policy_path, schema_path)
+
+
+def _validate_policy_with(policy_config: Any, validator: Validator, policy_path: str, schema_path: str) -> None:
+    """Validate the adapter policy JSON with an already compiled validator."""
     try:
-        validate(instance=policy_config, schema=schema_config)
+        validate_with_validator(policy_config, validator)
     except ValidationError as exc:
         loc = "/".join(str(p) for p in exc.absolute_path) if exc.absolute_path else "<root>"
         raise ValueError(
@@ -76,13 +98,13 @@ def validate_policy_config(policy_config: Any, schema_config: Any, policy_path:
 
 def discover_architectures(input_dir: str) -> List[str]:
     """Discover available architectures from input directory structure."""
-    archs = []
-    if os.path.isdir(input_dir):
-        for item in os.listdir(input_dir):
-            item_path = os.path.join(input_dir, item)
-            if os.path.isdir(item_path):
-                archs.append(item)
-    return archs
+    # scandir's DirEntry carries the file type from readdir, so is_dir()
+    # normally needs no extra stat() per entry.
+    try:
+        with os.scandir(input_dir) as entries:
+            return [entry.name for entry in entries if entry.is_dir()]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
 
 
 def discover_os_versions(input_dir: str, arch: str) -> List[Tuple[str, str]]:
@@ -91,17 +113,20 @@ def discover_os_versions(input_dir: str, arch: str) -> List[Tuple[str, str]]:
     Returns list of (os_family, version) tuples.
     """
     results = []
-    arch_path = os.path.join(input_dir, arch)
-    if not os.path.isdir(arch_path):
+    try:
+        os_families = os.scandir(os.path.join(input_dir, arch))
+    except (FileNotFoundError, NotADirectoryError):
         return results
 
-    for os_family in os.listdir(arch_path):
-        os_family_path = os.path.join(arch_path, os_family)
-        if os.path.isdir(os_family_path):
-            for version in os.listdir(os_family_path):
-                version_path = os.path.join(os_family_path, version)
-                if os.path.isdir(version_path):
-                    results.append((os_family, version))
+    # DirEntry.path is already joined, so nested levels need no os.path.join.
+    with os_families:
+        for os_family in os_families:
+            if not os_family.is_dir():
+                continue
+            with os.scandir(os_family.path) as versions:
+                for version in versions:
+                    if version.is_dir():
+                        results.append((os_family.name, version.name))
     return results
 
 
@@ -274,51 +299,85 @@ def generate_software_config(
     logger.info("Generated software_config.json at: %s", output_path)
 
 
-def _package_key(pkg: Dict) -> Tuple[str, str, str]:
+def _hashable_value(v: Any) -> Any:
+    """Return a hashable stand-in for a package field value."""
+    if isinstance(v, (dict, list)):
+        return orjson.dumps(v, option=orjson.OPT_SORT_KEYS)
+    return v
+
+
+def _package_key(pkg: Dict) -> FrozenSet[Tuple[str, Any]]:
     """Generate a stable key for a package.
 
     For v2 derived operations (common package extraction), we want equivalence based on
     the full package definition except architecture. This avoids collisions for tarballs
     where repo_name is absent and uri differs.
     """
-
-    def _hashable(v: Any) -> Any:
-        if isinstance(v, (dict, list)):
-            return json.dumps(v, sort_keys=True)
-        return v
-
-    return tuple(
-        sorted(
-            (k, _hashable(v))
-            for k, v in pkg.items()
-            if k != "architecture"
-        )
+    # Field order is irrelevant to equality, so a frozenset avoids sorting.
+    return frozenset(
+        (k, _hashable_value(v))
+        for k, v in pkg.items()
+        if k != "architecture"
     )
 
 
 def transform_package(pkg: Dict, transform_config: Optional[Dict]) -> Dict:
     """Apply transformation rules to a package dict (excluding filter)."""
-    if not transform_config:
-        return pkg.copy()
+    return transform_packages([pkg], transform_config)[0]
 
-    result = pkg.copy()
 
+def transform_packages(packages: List[Dict], transform_config: Optional[Dict]) -> List[Dict]:
+    """Apply transform_package to each package, resolving the rules once."""
+    if not packages:
+        return []
+    if not transform_config:
+        return [pkg.copy() for pkg in packages]
+
+    exclude_fields = frozenset(transform_config.get(schema.EXCLUDE_FIELDS, []))
+    rename_fields = transform_config.get(schema.RENAME_FIELDS, {})
     # Auto-exclude versions for non-git packages, except UCX and OpenMPI
-    package_type = result.get("type")
-    package_name = result.get("package")
-    if package_type != "git" and package_name not in ("ucx", "openmpi"):
-        result.pop("version", None)
+    exclude_with_version = exclude_fields | {"version"}
 
-    exclude_fields = transform_config.get(schema.EXCLUDE_FIELDS, [])
-    for field in exclude_fields:
-        result.pop(field, None)
+    results: List[Dict] = []
+    for pkg in packages:
+        if pkg.get("type") != "git" and pkg.get("package") not in ("ucx", "openmpi"):
+            excluded = exclude_with_version
+        else:
+            excluded = exclude_fields
+        result = {k: v for k, v in pkg.items() if k not in excluded}
 
-    rename_fields = transform_config.get(schema.RENAME_FIELDS, {})
-    for old_name, new_name in rename_fields.items():
-        if old_name in result:
-            result[new_name] = result.pop(old_name)
+        for old_name, new_name in rename_fields.items():
+            if old_name in result:
+                result[new_name] = result.pop(old_name)
 
-    return result
+        results.append(result)
+    return results
+
+
+@lru_cache(maxsize=256)
+def _normalized_needles(values: Tuple, case_sensitive: bool) -> Tuple:
+    """Return substring filter values, lowercased unless case-sensitive."""
+    if case_sensitive:
+        return values
+    return tuple(v.lower() for v in values)
+
+
+# With this many needles, one regex scan beats a containment check per needle.
+_MIN_NEEDLES_FOR_MATCHER = 4
+
+
+@lru_cache(maxsize=256)
+def _needle_matcher(needles: Tuple[str, ...]) -> re.Pattern:
+    """Compile an alternation that matches if any needle occurs in a string."""
+    return re.compile("|".join(map(re.escape, needles)))
+
+
+@lru_cache(maxsize=256)
+def _normalized_allowlist(values: Tuple, case_sensitive: bool) -> frozenset:
+    """Return allowlist filter values as a set of (lowercased) strings."""
+    if case_sensitive:
+        return frozenset(str(v) for v in values)
+    return frozenset(str(v).lower() for v in values)
 
 
 def apply_substring_filter(
@@ -333,16 +392,23 @@ def apply_substring_filter(
     if not values:
         return packages
 
+    check_values = _normalized_needles(tuple(values), case_sensitive)
+    matcher = (
+        _needle_matcher(check_values)
+        if len(check_values) >= _MIN_NEEDLES_FOR_MATCHER
+        else None
+    )
+
     filtered = []
     for pkg in packages:
         field_value = pkg.get(field, "")
         if not case_sensitive:
             field_value = field_value.lower()
-            check_values = [v.lower() for v in values]
-        else:
-            check_values = values
 
-        if any(v in field_value for v in check_values):
+        if matcher is not None and isinstance(field_value, str):
+            if matcher.search(field_value):
+                filtered.append(pkg)
+        elif any(v in field_value for v in check_values):
             filtered.append(pkg)
 
     return filtered
@@ -359,10 +425,7 @@ def apply_allowlist_filter(
     if not values:
         return packages
 
-    if not case_sensitive:
-        allowed = {str(v).lower() for v in values}
-    else:
-        allowed = {str(v) for v in values}
+    allowed = _normalized_allowlist(tuple(values), case_sensitive)
 
     result: List[Dict] = []
     for pkg in packages:
@@ -388,10 +451,7 @@ def apply_field_in_filter(
     if not field or not values:
         return packages
 
-    if not case_sensitive:
-        allowed = {str(v).lower() for v in values}
-    else:
-        allowed = {str(v) for v in values}
+    allowed = _normalized_allowlist(tuple(values), case_sensitive)
 
     result: List[Dict] = []
     for pkg in packages:
@@ -424,29 +484,28 @@ def apply_any_of_filter(
     if not filters:
         return packages
 
-    result: List[Dict] = []
-    for pkg in packages:
-        for sub_filter in filters:
-            filtered = apply_filter([pkg], source_data, source_key, sub_filter)
-            if filtered:
-                result.append(pkg)
-                break
-    return result
+    # Run each sub-filter once over the whole list, then keep the matched
+    # packages in their original order.
+    matched_ids: set = set()
+    for sub_filter in filters:
+        for pkg in apply_filter(packages, source_data, source_key, sub_filter):
+            matched_ids.add(id(pkg))
+    return [pkg for pkg in packages if id(pkg) in matched_ids]
 
 
 def compute_common_packages(
     source_data: Dict,
     compare_keys: List[str],
     min_occurrences: int = 2
-) -> Tuple[set, Dict[Tuple, Dict]]:
+) -> Tuple[set, Dict[FrozenSet, Dict]]:
     """Compute packages that appear in multiple source keys.
 
     Returns:
         - Set of common package keys
         - Dict mapping package key to package dict
     """
-    key_counts: Counter = Counter()
-    key_to_pkg: Dict[Tuple, Dict] = {}
+    key_counts: Dict[FrozenSet, int] = {}
+    key_to_pkg: Dict[FrozenSet, Dict] = {}
 
     for source_key in compare_keys:
         if source_key not in source_data:
@@ -461,7 +520,7 @@ def compute_common_packages(
             key_to_pkg.setdefault(k, pkg)
             if k not in seen_in_this_key:
                 seen_in_this_key.add(k)
-                key_counts[k] += 1
+                key_counts[k] = key_counts.get(k, 0) + 1
 
     common_keys = {k for k, count in key_counts.items() if count >= min_occurrences}
     return common_keys, key_to_pkg
@@ -522,23 +581,24 @@ def apply_filter(
         return packages
 
     filter_type = filter_config.get(schema.TYPE)
-
-    if filter_type == schema.SUBSTRING_FILTER:
-        return apply_substring_filter(packages, filter_config)
-
-    if filter_type == schema.ALLOWLIST_FILTER:
-        return apply_allowlist_filter(packages, filter_config)
-
-    if filter_type == schema.FIELD_IN_FILTER:
-        return apply_field_in_filter(packages, filter_config)
-
-    if filter_type == schema.ANY_OF_FILTER:
-        return apply_any_of_filter(packages, _source_data, _source_key, filter_config)
+    apply_fn = _FILTER_DISPATCH.get(filter_type)
+    if apply_fn is not None:
+        return apply_fn(packages, _source_data, _source_key, filter_config)
 
     logger.warning("Unknown/unsupported filter type in v2: %s", filter_type)
     return packages
 
 
+# Filter type -> implementation, all called as
+# (packages, source_data, source_key, filter_config).
+_FILTER_DISPATCH: Dict[str, Callable[[List[Dict], Dict, str, Dict], List[Dict]]] = {
+    schema.SUBSTRING_FILTER: lambda pkgs, _data, _key, cfg: apply_substring_filter(pkgs, cfg),
+    schema.ALLOWLIST_FILTER: lambda pkgs, _data, _key, cfg: apply_allowlist_filter(pkgs, cfg),
+    schema.FIELD_IN_FILTER: lambda pkgs, _data, _key, cfg: apply_field_in_filter(pkgs, cfg),
+    schema.ANY_OF_FILTER: apply_any_of_filter,
+}
+
+
 def merge_transform(base: Optional[Dict], override: Optional[Dict]) -> Optional[Dict]:
     """Merge two transform dicts where override wins."""
     if not base and not override:
@@ -558,15 +618,24 @@ def compute_common_keys_from_roles(
     min_occurrences: int
 ) -> set:
     """Compute package keys that are common across the given target roles."""
-    key_counts: Counter = Counter()
-    for role_key in from_keys:
-        pkgs = roles.get(role_key, [])
-        seen_in_role: set = set()
-        for pkg in pkgs:
-            k = _package_key(pkg)
-            if k not in seen_in_role:
-                seen_in_role.add(k)
-                key_counts[k] += 1
+    return _common_keys(
+        (map(_package_key, roles.get(role_key, [])) for role_key in from_keys),
+        min_occurrences,
+    )
+
+
+def _common_keys(
+    keys_per_role: Iterable[Iterable[FrozenSet]],
+    min_occurrences: int
+) -> set:
+    """Return the keys found in at least min_occurrences roles.
+
+    Each role's keys are counted once, however often a key repeats in it.
+    """
+    key_counts: Dict[FrozenSet, int] = {}
+    for role_keys in keys_per_role:
+        for k in set(role_keys):
+            key_counts[k] = key_counts.get(k, 0) + 1
     return {k for k, count in key_counts.items() if count >= min_occurrences}
 
 
@@ -578,13 +647,23 @@ def derive_common_role(
     remove_from_sources: bool = True
 ) -> None:
     """Derive a common role and optionally remove common packages from source roles."""
-    common_keys = compute_common_keys_from_roles(target_roles, from_keys, min_occurrences)
+    # Key every source package once; counting, selection and removal all
+    # reuse these keys.
+    keyed_roles: Dict[str, List[Tuple[Dict, FrozenSet]]] = {}
+    for role_key in from_keys:
+        if role_key not in keyed_roles:
+            keyed_roles[role_key] = [
+                (pkg, _package_key(pkg)) for pkg in target_roles.get(role_key, [])
+            ]
+    common_keys = _common_keys(
+        ((k for _, k in keyed_roles[role_key]) for role_key in from_keys),
+        min_occurrences,
+    )
 
     common_pkgs: List[Dict] = []
     seen: set = set()
     for role_key in from_keys:
-        for pkg in target_roles.get(role_key, []):
-            k = _package_key(pkg)
+        for pkg, k in keyed_roles[role_key]:
             if k in common_keys and k not in seen:
                 seen.add(k)
                 common_pkgs.append(pkg)
@@ -593,9 +672,12 @@ def derive_common_role(
 
     if remove_from_sources:
         for role_key in from_keys:
+            if role_key == derived_key:
+                # Already replaced by common_pkgs, all of which are common.
+                target_roles[role_key] = []
+                continue
             target_roles[role_key] = [
-                pkg for pkg in target_roles.get(role_key, [])
-                if _package_key(pkg) not in common_keys
+                pkg for pkg, k in keyed_roles[role_key] if k not in common_keys
             ]
 
 
@@ -624,6 +706,21 @@ def check_conditions(
     return True
 
 
+def _freeze_target_conditions(targets: Dict[str, Dict]) -> None:
+    """Turn target condition lists into frozensets, in place.
+
+    Set membership keeps check_conditions constant-time, and duplicate
+    values are expanded only once when targets are indexed by partition.
+    """
+    for target_spec in targets.values():
+        conditions = target_spec.get(schema.CONDITIONS)
+        if not conditions:
+            continue
+        for key in (schema.ARCHITECTURES, schema.OS_FAMILIES, schema.OS_VERSIONS):
+            if key in conditions:
+                conditions[key] = frozenset(conditions[key])
+
+
 def process_target_spec(
     target_file: str,
     target_spec: Dict,
@@ -639,6 +736,22 @@ def process_target_spec(
         logger.debug("Skipping target %s (conditions not met)", target_file)
         return
 
+    _build_target(
+        target_file, target_spec, source_files, target_configs,
+        arch, os_family, os_version,
+    )
+
+
+def _build_target(
+    target_file: str,
+    target_spec: Dict,
+    source_files: Dict[str, Dict],
+    target_configs: Dict[str, Dict],
+    arch: str,
+    os_family: str,
+    os_version: str
+) -> None:
+    """Build a target whose conditions are already known to match."""
     target_level_transform = target_spec.get(schema.TRANSFORM)
 
     target_roles: Dict[str, List[Dict]] = {}
@@ -661,9 +774,15 @@ def process_target_spec(
             filter_config = pull.get(schema.FILTER)
             pull_transform = merge_transform(target_level_transform, pull.get(schema.TRANSFORM))
 
-            packages = source_data[source_key].get(schema.PACKAGES, [])
-            packages = apply_filter(packages, source_data, source_key, filter_config)
-            packages = [transform_package(pkg, pull_transform) for pkg in packages]
+            packages = transform_packages(
+                apply_filter(
+                    source_data[source_key].get(schema.PACKAGES, []),
+                    source_data,
+                    source_key,
+                    filter_config,
+                ),
+                pull_transform,
+            )
 
             if target_key in target_roles:
                 target_roles[target_key].extend(packages)
@@ -724,29 +843,116 @@ def write_config_file(file_path: str, config: Dict) -> None:
     """Write a config JSON file with proper formatting."""
     os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
+    sections = []
+    for top_key, body in config.items():
+        pkg_lines = ",\n".join(
+            "      " + _encode_pkg(pkg) for pkg in body.get(schema.CLUSTER, [])
+        )
+        sections.append(
+            f'  "{top_key}": {{\n'
+            f'    "{schema.CLUSTER}": [\n'
+            + (pkg_lines + "\n" if pkg_lines else "")
+            + "    ]\n"
+            "  }"
+        )
+    rendered = "{\n" + ",\n".join(sections) + ("\n" if sections else "") + "}\n"
+
     with open(file_path, "w", encoding="utf-8") as out_file:
-        out_file.write("{\n")
+        out_file.write(rendered)
 
-        items = list(config.items())
-        for i, (top_key, body) in enumerate(items):
-            out_file.write(f'  "{top_key}": {{\n')
-            out_file.write(f'    "{schema.CLUSTER}": [\n')
 
-            pkgs = body.get(schema.CLUSTER, [])
-            for j, pkg in enumerate(pkgs):
-                line = "      " + json.dumps(pkg, separators=(", ", ": "))
-                if j < len(pkgs) - 1:
-                    line += ","
-                out_file.write(line + "\n")
+def _index_targets_by_partition(
+    targets: Dict[str, Dict],
+    partitions: List[Tuple[str, str, str]],
+) -> Dict[Tuple[str, str, str], Dict[str, Dict]]:
+    """Map each (arch, os_family, version) partition to its matching targets.
 
-            out_file.write("    ]\n")
-            out_file.write("  }")
-            if i < len(items) - 1:
-                out_file.write(",\n")
-            else:
-                out_file.write("\n")
+    Each target is registered only under the partitions its conditions
+    allow, by expanding the allowed values; a condition key that is absent
+    allows every discovered value. Targets keep policy order.
+    """
+    index: Dict[Tuple[str, str, str], Dict[str, Dict]] = {p: {} for p in partitions}
+    all_archs = {arch for arch, _, _ in partitions}
+    all_os_families = {os_family for _, os_family, _ in partitions}
+    all_versions = {version for _, _, version in partitions}
+
+    for target_file, target_spec in targets.items():
+        conditions = target_spec.get(schema.CONDITIONS) or {}
+        for key in product(
+            conditions.get(schema.ARCHITECTURES, all_archs),
+            conditions.get(schema.OS_FAMILIES, all_os_families),
+            conditions.get(schema.OS_VERSIONS, all_versions),
+        ):
+            partition_targets = index.get(key)
+            if partition_targets is not None:
+                partition_targets[target_file] = target_spec
+    return index
+
+
+def _process_partition(
+    input_dir: str,
+    output_dir: str,
+    targets: Dict[str, Dict],
+    arch: str,
+    os_family: str,
+    version: str,
+) -> Optional[Dict[str, Dict]]:
+    """Build and write all target configs for one (arch, os_family, version).
+
+    targets must already be limited to those whose conditions match this
+    partition (see _index_targets_by_partition). Returns the generated target configs, or None if the source directory
+    is missing.
+    """
+    logger.info("Processing: arch=%s, os=%s, version=%s", arch, os_family, version)
+
+    source_dir = os.path.join(input_dir, arch, os_family, version)
+    target_dir = os.path.join(output_dir, "input", "config", arch, os_family, version)
+
+    if not os.path.isdir(source_dir):
+        logger.warning("Source directory not found, skipping: %s", source_dir)
+        return None
+
+    with os.scandir(source_dir) as entries:
+        json_entries = [
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.name.endswith(".json") and entry.is_file()
+        ]
+
+    source_files: Dict[str, Dict] = {}
+    if len(json_entries) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(_MAX_LOAD_WORKERS, len(json_entries))
+        ) as executor:
+            loaded = executor.map(load_json_file, [path for _, path in json_entries])
+            for (name, _), data in zip(json_entries, loaded):
+                source_files[name] = data
+                logger.debug("Loaded source file: %s", name)
+    else:
+        for name, path in json_entries:
+            source_files[name] = load_json_file(path)
+            logger.debug("Loaded source file: %s", name)
+
+    target_configs: Dict[str, Dict] = {}
+
+    for target_file, target_spec in targets.items():
+        _build_target(
+            target_file=target_file,
+            target_spec=target_spec,
+            source_files=source_files,
+            target_configs=target_configs,
+            arch=arch,
+            os_family=os_family,
+            os_version=version
+        )
+
+    for target_file, data in target_configs.items():
+        if data:
+            file_path = os.path.join(target_dir, target_file)
+            write_config_file(file_path, data)
+            logger.info("Written: %s", file_path)
 
-        out_file.write("}\n")
+    return target_configs
 
 
 def generate_configs_from_policy(
@@ -777,9 +983,11 @@ def generate_configs_from_policy(
     _validate_input_policy_and_schema_paths(input_dir, policy_path, schema_path)
 
     policy_config = load_json_file(policy_path)
-    schema_config = load_json_file(schema_path)
-    validate_policy_config(policy_config, schema_config, policy_path=policy_path, schema_path=schema_path)
+    # The validator is cached per schema file, so repeated runs only pay the
+    # schema check and compile cost once.
+    _validate_policy_with(policy_config, load_schema_validator(schema_path), policy_path, schema_path)
     targets = policy_config.get(schema.TARGETS, {})
+    _freeze_target_conditions(targets)
 
     logger.info("Loaded %d target(s) from %s", len(targets), policy_path)
 
@@ -796,49 +1004,28 @@ def generate_configs_from_policy(
     resolved_os_family: Optional[str] = None
     resolved_os_version: Optional[str] = None
 
-    for arch in architectures:
-        os_versions = discover_os_versions(input_dir, arch)
-
-        for os_family, version in os_versions:
-            logger.info("Processing: arch=%s, os=%s, version=%s", arch, os_family, version)
-
-            if resolved_os_family is None:
-                resolved_os_family = os_family
-                resolved_os_version = version
-
-            source_dir = os.path.join(input_dir, arch, os_family, version)
-            target_dir = os.path.join(output_dir, "input", "config", arch, os_family, version)
-
-            if not os.path.isdir(source_dir):
-                logger.warning("Source directory not found, skipping: %s", source_dir)
-                continue
-
-            source_files: Dict[str, Dict] = {}
-            for filename in os.listdir(source_dir):
-                if filename.endswith(".json"):
-                    file_path = os.path.join(source_dir, filename)
-                    source_files[filename] = load_json_file(file_path)
-                    logger.debug("Loaded source file: %s", filename)
-
-            target_configs: Dict[str, Dict] = {}
-
-            for target_file, target_spec in targets.items():
-                process_target_spec(
-                    target_file=target_file,
-                    target_spec=target_spec,
-                    source_files=source_files,
-                    target_configs=target_configs,
-                    arch=arch,
-                    os_family=os_family,
-                    os_version=version
-                )
-
-            for target_file, data in target_configs.items():
-                if data:
-                    file_path = os.path.join(target_dir, target_file)
-                    write_config_file(file_path, data)
-                    logger.info("Written: %s", file_path)
-
+    partitions = [
+        (arch, os_family, version)
+        for arch in architectures
+        for os_family, version in discover_os_versions(input_dir, arch)
+    ]
+    targets_by_partition = _index_targets_by_partition(targets, partitions)
+
+    for partition in partitions:
+        arch, os_family, version = partition
+        if resolved_os_family is None:
+            resolved_os_family = os_family
+            resolved_os_version = version
+
+        target_configs = _process_partition(
+            input_dir,
+            output_dir,
+            targets_by_partition[partition],
+            arch,
+            os_family,
+            version,
+        )
+        if target_configs is not None:
             all_arch_target_configs[arch] = target_configs
 
     generate_software_config(
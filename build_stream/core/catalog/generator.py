@@ -19,18 +19,27 @@ catalog, and to load/validate feature-list JSONs.
 """
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 import json
 import logging
 import os
 import sys
 from typing import Dict, List, Optional, Tuple
 
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.protocols import Validator
 
 from .models import Catalog
 from .parser import ParseCatalog
-from .utils import _configure_logging, load_json_file
+from .utils import (
+    _configure_logging,
+    get_schema_validator,
+    load_json_file,
+    validate_with_validator,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +47,21 @@ _BASE_DIR = os.path.dirname(__file__)
 _DEFAULT_SCHEMA_PATH = os.path.join(_BASE_DIR, "resources", "CatalogSchema.json")
 _ROOT_LEVEL_SCHEMA_PATH = os.path.join(_BASE_DIR, "resources", "RootLevelSchema.json")
 
+# Root JSON files written per (arch, os, version), in generation order.
+_ROOT_JSON_FILENAMES = (
+    "functional_layer.json",
+    "infrastructure.json",
+    "drivers.json",
+    "base_os.json",
+    "miscellaneous.json",
+)
+
+# Upper bound on concurrent root JSON file writes.
+_MAX_WRITE_WORKERS = 8
+
+# Reused encoder for the one-package-per-line FeatureList layout.
+_encode_pkg = json.JSONEncoder(separators=(", ", ": ")).encode
+
 ERROR_CODE_INPUT_NOT_FOUND = 2
 ERROR_CODE_PROCESSING_ERROR = 3
 
@@ -73,7 +97,7 @@ def _arch_suffix(architecture) -> str:
     return str(arch)
 
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """Represents a package entry inside a generated FeatureList JSON."""
 
@@ -87,7 +111,7 @@ class Package:
     sources: Optional[List[dict]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Feature:
     """Represents a single feature/role entry containing a list of packages."""
 
@@ -95,7 +119,7 @@ class Feature:
     packages: List[Package]
 
 
-@dataclass
+@dataclass(slots=True)
 class FeatureList:
     """Collection of features keyed by feature/role name."""
 
@@ -110,13 +134,19 @@ def _filter_featurelist_for_arch(feature_list: FeatureList, arch: str) -> Featur
     filtered_features: Dict[str, Feature] = {}
     for name, feature in feature_list.features.items():
         narrowed_pkgs: List[Package] = []
+        append = narrowed_pkgs.append
         for p in feature.packages:
-            if arch in getattr(p, "architecture", []):
+            if arch in p.architecture:
+                # arch is present, so a single-entry list is exactly [arch].
+                if not p.sources and not p.repo_name and len(p.architecture) == 1:
+                    # Narrowing would rebuild an identical Package; reuse it.
+                    append(p)
+                    continue
                 # Derive repo_name and uri from the catalog Sources metadata, if
                 # present, for this specific architecture.
                 repo_name = ""
-                uri = getattr(p, "uri", None)
-                if getattr(p, "sources", None):
+                uri = p.uri
+                if p.sources:
                     for src in p.sources:
                         if src.get("Architecture") == arch:
                             if "RepoName" in src:
@@ -125,55 +155,59 @@ def _filter_featurelist_for_arch(feature_list: FeatureList, arch: str) -> Featur
                                 uri = src["Uri"]
                             break
 
-                narrowed_pkgs.append(
+                # Positional in Package field order (see _package_from_json_dict).
+                append(
                     Package(
-                        package=p.package,
-                        version=getattr(p, "version", None),
-                        type=p.type,
-                        repo_name=repo_name,
-                        architecture=[arch],
-                        uri=uri,
-                        tag=p.tag,
-                        sources=p.sources,
+                        p.package, p.version, p.type, repo_name,
+                        [arch], uri, p.tag, p.sources,
                     )
                 )
         filtered_features[name] = Feature(feature_name=name, packages=narrowed_pkgs)
     return FeatureList(features=filtered_features)
 
 
-def _discover_arch_os_version_from_catalog(catalog: Catalog) -> List[Tuple[str, str, str]]:
-    """Discover distinct (arch, os_name, version) combinations in the Catalog.
+@lru_cache(maxsize=1024)
+def _parse_os_entry(os_entry: str) -> Tuple[str, str]:
+    """Split a supported_os entry like "RHEL 10.0" into ("rhel", "10.0").
 
-    os_name is returned in lowercase (e.g. "rhel"), version as-is.
+    Catalogs repeat the same few OS strings on every package, so the parse
+    is memoized per distinct entry.
     """
+    os_name_raw, _, os_ver = os_entry.partition(" ")
+    return os_name_raw.lower(), os_ver
 
-    combos: set[Tuple[str, str, str]] = set()
 
-    def _add_from_packages(packages):
-        for pkg in packages:
-            for os_entry in pkg.supported_os:
-                parts = os_entry.split(" ", 1)
-                if len(parts) == 2:
-                    os_name_raw, os_ver = parts
-                else:
-                    os_name_raw, os_ver = os_entry, ""
-                os_name = os_name_raw.lower()
+def _discover_arch_os_version_from_catalog(catalog: Catalog) -> List[Tuple[str, str, str]]:
+    """Discover distinct (arch, os_name, version) combinations in the Catalog.
 
-                for arch in pkg.architecture:
-                    combos.add((arch, os_name, os_ver))
+    os_name is returned in lowercase (e.g. "rhel"), version as-is.
+    """
 
-    _add_from_packages(catalog.functional_packages)
-    _add_from_packages(catalog.os_packages)
+    parse_os_entry = _parse_os_entry
+    combos: set[Tuple[str, str, str]] = {
+        (arch, os_name, os_ver)
+        for pkg in chain(catalog.functional_packages, catalog.os_packages)
+        for os_name, os_ver in map(parse_os_entry, pkg.supported_os)
+        for arch in pkg.architecture
+    }
 
     combos_sorted = sorted(combos)
     logger.debug(
         "Discovered %d (arch, os, version) combinations in catalog %s",
         len(combos_sorted),
-        getattr(catalog, "name", "<unknown>"),
+        catalog.name,
     )
     return combos_sorted
 
 
+def _index_packages_by_id(packages) -> Dict[str, object]:
+    """Map package id -> package; the first package wins on duplicate ids."""
+    index: Dict[str, object] = {}
+    for pkg in packages:
+        index.setdefault(pkg.id, pkg)
+    return index
+
+
 def generate_functional_layer_json(catalog: Catalog) -> FeatureList:
     """
     Generates a JSON file containing the functional layer from a given catalog object.
@@ -185,6 +219,7 @@ def generate_functional_layer_json(catalog: Catalog) -> FeatureList:
     - FeatureList: The generated JSON data
     """
     output_json = FeatureList(features={})
+    packages_by_id = _index_packages_by_id(catalog.functional_packages)
 
     for layer in catalog.functional_layer:
         feature_json = Feature(
@@ -193,7 +228,7 @@ def generate_functional_layer_json(catalog: Catalog) -> FeatureList:
         )
 
         for pkg_id in layer["FunctionalPackages"]:
-            pkg = next((pkg for pkg in catalog.functional_packages if pkg.id == pkg_id), None)
+            pkg = packages_by_id.get(pkg_id)
             if pkg:
                 feature_json.packages.append(
                     Package(
@@ -203,7 +238,7 @@ def generate_functional_layer_json(catalog: Catalog) -> FeatureList:
                         repo_name="",
                         architecture=pkg.architecture,
                         uri=None,
-                        tag=getattr(pkg, "tag", None),
+                        tag=pkg.tag,
                         sources=pkg.sources,
                     )
                 )
@@ -224,6 +259,7 @@ def generate_infrastructure_json(catalog: Catalog) -> FeatureList:
     - FeatureList: The generated JSON data
     """
     output_json = FeatureList(features={})
+    packages_by_id = _index_packages_by_id(catalog.infrastructure_packages)
 
     for infra in catalog.infrastructure:
         feature_json = Feature(
@@ -232,7 +268,7 @@ def generate_infrastructure_json(catalog: Catalog) -> FeatureList:
         )
 
         for pkg_id in infra["InfrastructurePackages"]:
-            pkg = next((pkg for pkg in catalog.infrastructure_packages if pkg.id == pkg_id), None)
+            pkg = packages_by_id.get(pkg_id)
             if pkg:
                 feature_json.packages.append(
                     Package(
@@ -242,7 +278,7 @@ def generate_infrastructure_json(catalog: Catalog) -> FeatureList:
                         repo_name="",
                         architecture=pkg.architecture,
                         uri=None,
-                        tag=getattr(pkg, "tag", None),
+                        tag=pkg.tag,
                         sources=pkg.sources,
                     )
                 )
@@ -269,7 +305,7 @@ def generate_drivers_json(catalog: Catalog) -> FeatureList:
 
     # If no grouping is present (backward compatibility), fall back to a single
     # "Drivers" feature containing all drivers.
-    if not getattr(catalog, "drivers_layer", []):
+    if not catalog.drivers_layer:
         feature_json = Feature(
             feature_name="Drivers",
             packages=[]
@@ -341,10 +377,11 @@ def generate_base_os_json(catalog: Catalog) -> FeatureList:
         feature_name="Base OS",
         packages=[]
     )
+    packages_by_id = _index_packages_by_id(catalog.os_packages)
 
     for entry in catalog.base_os:
         for pkg_id in entry["osPackages"]:
-            pkg = next((pkg for pkg in catalog.os_packages if pkg.id == pkg_id), None)
+            pkg = packages_by_id.get(pkg_id)
             if pkg:
                 feature_json.packages.append(
                     Package(
@@ -354,7 +391,7 @@ def generate_base_os_json(catalog: Catalog) -> FeatureList:
                         repo_name="",
                         architecture=pkg.architecture,
                         uri=None,
-                        tag=getattr(pkg, "tag", None),
+                        tag=pkg.tag,
                         sources=pkg.sources,
                     )
                 )
@@ -378,9 +415,10 @@ def generate_miscellaneous_json(catalog: Catalog) -> FeatureList:
         packages=[],
     )
 
-    misc_ids = getattr(catalog, "miscellaneous", [])
+    misc_ids = catalog.miscellaneous
+    packages_by_id = _index_packages_by_id(catalog.functional_packages) if misc_ids else {}
     for pkg_id in misc_ids:
-        pkg = next((pkg for pkg in catalog.functional_packages if pkg.id == pkg_id), None)
+        pkg = packages_by_id.get(pkg_id)
         if not pkg:
             continue
 
@@ -392,7 +430,7 @@ def generate_miscellaneous_json(catalog: Catalog) -> FeatureList:
                 repo_name="",
                 architecture=pkg.architecture,
                 uri=None,
-                tag=getattr(pkg, "tag", None),
+                tag=pkg.tag,
                 sources=pkg.sources,
             )
         )
@@ -409,13 +447,13 @@ def _package_common_dict(pkg: Package) -> Dict:
     consistent for package, type, repo_name, uri, and tag.
     """
     data: Dict = {"package": pkg.package, "type": pkg.type}
-    if getattr(pkg, "version", None):
+    if pkg.version:
         data["version"] = pkg.version
-    if getattr(pkg, "repo_name", ""):
+    if pkg.repo_name:
         data["repo_name"] = pkg.repo_name
-    if getattr(pkg, "uri", None) is not None:
+    if pkg.uri is not None:
         data["uri"] = pkg.uri
-    if getattr(pkg, "tag", "") and pkg.tag != "":
+    if pkg.tag:
         data["tag"] = pkg.tag
     return data
 
@@ -427,75 +465,101 @@ def _package_to_json_dict(pkg: Package) -> Dict:
 
 
 def _package_from_json_dict(data: Dict) -> Package:
+    # Positional in Package field order: package, version, type, repo_name,
+    # architecture, uri, tag.
+    get = data.get
     return Package(
-        package=data["package"],
-        version=data.get("version"),
-        type=data["type"],
-        repo_name=data.get("repo_name", ""),
-        architecture=data.get("architecture", []),
-        uri=data.get("uri"),
-        tag=data.get("tag"),
+        data["package"],
+        get("version"),
+        data["type"],
+        get("repo_name", ""),
+        get("architecture", []),
+        get("uri"),
+        get("tag"),
     )
 
 
-def serialize_json(feature_list: FeatureList, output_path: str):
+def _render_feature_list(feature_list: FeatureList) -> str:
+    """Render a FeatureList in the root JSON layout.
+
+    Custom pretty-printer so that:
+      - Overall JSON is nicely indented
+      - Each package entry inside "packages" is a single-line JSON object
     """
-    Serializes the output JSON data to a file.
+    sections = []
+    for feature_name, feature in feature_list.features.items():
+        pkg_lines = ",\n".join(
+            "      " + _encode_pkg(_package_to_json_dict(pkg)) for pkg in feature.packages
+        )
+        sections.append(
+            f"  {json.dumps(feature_name)}: {{\n"
+            "    \"packages\": [\n"
+            + (pkg_lines + "\n" if pkg_lines else "")
+            + "    ]\n"
+            "  }"
+        )
+    return "{\n" + ",\n".join(sections) + ("\n" if sections else "") + "}\n"
 
-    Args:
-    - feature_list (FeatureList): The feature list data to serialize.
-    - output_path (str): The path to write the serialized JSON file to.
+
+def _file_has_content(path: str, content: bytes) -> bool:
+    """Return True if path is an existing file whose bytes equal content.
+
+    The size is checked first, so a differing file is usually rejected
+    without being read.
+    """
+    try:
+        if os.stat(path).st_size != len(content):
+            return False
+        with open(path, "rb") as existing:
+            return existing.read() == content
+    except (FileNotFoundError, IsADirectoryError):
+        return False
+
+
+def _write_rendered_feature_list(rendered: str, feature_count: int, output_path: str) -> None:
+    """Write an already rendered FeatureList to output_path.
+
+    The write is skipped when output_path already holds exactly the rendered
+    bytes, so re-running generation over an unchanged catalog leaves existing
+    files (and their modification times) untouched.
     """
-    # Custom pretty-printer so that:
-    #   - Overall JSON is nicely indented
-    #   - Each package entry inside "packages" is a single-line JSON object
+    data = rendered.encode("utf-8")
+    if _file_has_content(output_path, data):
+        logger.info("FeatureList at %s is unchanged; skipping write", output_path)
+        return
     logger.info(
         "Writing FeatureList with %d feature(s) to %s",
-        len(feature_list.features),
+        feature_count,
         output_path,
     )
-    with open(output_path, "w", encoding="utf-8") as out_file:
-        out_file.write("{\n")
-
-        items = list(feature_list.features.items())
-        for i, (feature_name, feature) in enumerate(items):
-            # Feature key
-            out_file.write(f"  {json.dumps(feature_name)}: {{\n")
-            out_file.write("    \"packages\": [\n")
+    with open(output_path, "wb") as out_file:
+        out_file.write(data)
 
-            pkgs = feature.packages
-            for j, pkg in enumerate(pkgs):
-                pkg_dict = _package_to_json_dict(pkg)
-                line = "      " + json.dumps(pkg_dict, separators=(", ", ": "))
-                if j < len(pkgs) - 1:
-                    line += ","
-                out_file.write(line + "\n")
 
-            out_file.write("    ]\n")
-            out_file.write("  }")
-            if i < len(items) - 1:
-                out_file.write(",\n")
-            else:
-                out_file.write("\n")
+def serialize_json(feature_list: FeatureList, output_path: str):
+    """
+    Serializes the output JSON data to a file.
 
-        out_file.write("}\n")
+    Args:
+    - feature_list (FeatureList): The feature list data to serialize.
+    - output_path (str): The path to write the serialized JSON file to.
+    """
+    _write_rendered_feature_list(
+        _render_feature_list(feature_list), len(feature_list.features), output_path
+    )
 
 
-def deserialize_json(input_path: str) -> FeatureList:
+def deserialize_json_data(json_data: Dict) -> FeatureList:
     """
-    Deserializes a JSON file to output JSON data.
+    Deserializes already parsed feature-list JSON data.
 
     Args:
-    - input_path (str): The path to read the JSON file from.
+    - json_data (Dict): Parsed feature-list JSON, keyed by feature name.
 
     Returns:
     - FeatureList: The deserialized JSON data
     """
-    json_data = load_json_file(input_path)
-
-    logger.debug("Deserializing FeatureList from %s", input_path)
-
-    feature_list = FeatureList(
+    return FeatureList(
         features={
             feature_name: Feature(
                 feature_name=feature_name,
@@ -508,6 +572,23 @@ def deserialize_json(input_path: str) -> FeatureList:
         }
     )
 
+
+def deserialize_json(input_path: str) -> FeatureList:
+    """
+    Deserializes a JSON file to output JSON data.
+
+    Args:
+    - input_path (str): The path to read the JSON file from.
+
+    Returns:
+    - FeatureList: The deserialized JSON data
+    """
+    json_data = load_json_file(input_path)
+
+    logger.debug("Deserializing FeatureList from %s", input_path)
+
+    feature_list = deserialize_json_data(json_data)
+
     logger.info(
         "Deserialized FeatureList with %d feature(s) from %s",
         len(feature_list.features),
@@ -517,6 +598,13 @@ def deserialize_json(input_path: str) -> FeatureList:
     return feature_list
 
 
+@lru_cache(maxsize=1)
+def _root_level_validator() -> Validator:
+    """Load RootLevelSchema.json and compile its validator once per process."""
+    logger.debug("Loading root-level schema from %s", _ROOT_LEVEL_SCHEMA_PATH)
+    return get_schema_validator(load_json_file(_ROOT_LEVEL_SCHEMA_PATH))
+
+
 def get_functional_layer_roles_from_file(
     functional_layer_json_path: str,
     *,
@@ -533,14 +621,11 @@ def get_functional_layer_roles_from_file(
         _configure_logging(log_file=log_file, log_level=log_level)
 
     logger.info("get_functional_layer_roles_from_file started for %s", functional_layer_json_path)
-    logger.debug("Loading root-level schema from %s", _ROOT_LEVEL_SCHEMA_PATH)
-    schema = load_json_file(_ROOT_LEVEL_SCHEMA_PATH)
-
     logger.debug("Validating JSON")
     json_data = load_json_file(functional_layer_json_path)
 
     try:
-        validate(instance=json_data, schema=schema)
+        validate_with_validator(json_data, _root_level_validator())
     except ValidationError as exc:
         logger.error(
             "JSON validation failed for %s",
@@ -549,9 +634,10 @@ def get_functional_layer_roles_from_file(
         raise
     logger.info("JSON validation succeeded")
 
-    feature_list = deserialize_json(functional_layer_json_path)
+    # Role names are the top-level keys, so the packages need not be
+    # deserialized just to list them.
     logger.debug("Populating roles info")
-    roles = list(feature_list.features.keys())
+    roles = list(json_data)
     logger.info(
         "get_functional_layer_roles_from_file completed for %s (roles=%d)",
         functional_layer_json_path,
@@ -604,16 +690,11 @@ def get_package_list(
         logger.error("File not found: %s", functional_layer_json_path)
         raise FileNotFoundError(functional_layer_json_path)
 
-    logger.debug("Loading root-level schema from %s", _ROOT_LEVEL_SCHEMA_PATH)
-    with open(_ROOT_LEVEL_SCHEMA_PATH, "r", encoding="utf-8") as f:
-        schema = json.load(f)
-
     logger.debug("Loading and validating JSON from %s", functional_layer_json_path)
-    with open(functional_layer_json_path, "r", encoding="utf-8") as f:
-        json_data = json.load(f)
+    json_data = load_json_file(functional_layer_json_path)
 
     try:
-        validate(instance=json_data, schema=schema)
+        validate_with_validator(json_data, _root_level_validator())
     except ValidationError as exc:
         logger.error(
             "JSON validation failed for %s",
@@ -623,7 +704,7 @@ def get_package_list(
     logger.info("JSON validation succeeded for %s", functional_layer_json_path)
 
     logger.debug("Deserializing feature list from %s", functional_layer_json_path)
-    feature_list = deserialize_json(functional_layer_json_path)
+    feature_list = deserialize_json_data(json_data)
 
     available_roles = list(feature_list.features.keys())
     logger.debug("Available roles: %s", available_roles)
@@ -736,6 +817,18 @@ def generate_root_json_from_catalog(
         "Discovered %d combination(s) for feature-list generation", len(combos)
     )
 
+    # Filtering and rendering depend only on arch, so each feature list is
+    # rendered once per arch and the text is reused for every (os, version).
+    feature_lists = (
+        functional_layer_json,
+        infrastructure_json,
+        drivers_json,
+        base_os_json,
+        miscellaneous_json,
+    )
+    rendered_by_arch: Dict[str, List[Tuple[str, int]]] = {}
+    writes: List[Tuple[str, int, str]] = []
+
     for arch, os_name, version in combos:
         base_dir = os.path.join(output_root, arch, os_name, version)
         os.makedirs(base_dir, exist_ok=True)
@@ -748,17 +841,25 @@ def generate_root_json_from_catalog(
             base_dir,
         )
 
-        func_arch = _filter_featurelist_for_arch(functional_layer_json, arch)
-        infra_arch = _filter_featurelist_for_arch(infrastructure_json, arch)
-        drivers_arch = _filter_featurelist_for_arch(drivers_json, arch)
-        base_os_arch = _filter_featurelist_for_arch(base_os_json, arch)
-        misc_arch = _filter_featurelist_for_arch(miscellaneous_json, arch)
-
-        serialize_json(func_arch, os.path.join(base_dir, 'functional_layer.json'))
-        serialize_json(infra_arch, os.path.join(base_dir, 'infrastructure.json'))
-        serialize_json(drivers_arch, os.path.join(base_dir, 'drivers.json'))
-        serialize_json(base_os_arch, os.path.join(base_dir, 'base_os.json'))
-        serialize_json(misc_arch, os.path.join(base_dir, 'miscellaneous.json'))
+        rendered = rendered_by_arch.get(arch)
+        if rendered is None:
+            rendered = []
+            for feature_list in feature_lists:
+                narrowed = _filter_featurelist_for_arch(feature_list, arch)
+                rendered.append((_render_feature_list(narrowed), len(narrowed.features)))
+            rendered_by_arch[arch] = rendered
+
+        for filename, (text, feature_count) in zip(_ROOT_JSON_FILENAMES, rendered):
+            writes.append((text, feature_count, os.path.join(base_dir, filename)))
+
+    # Rendering is done; the remaining work is plain file I/O.
+    if len(writes) <= 1:
+        for write in writes:
+            _write_rendered_feature_list(*write)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(writes))) as executor:
+        list(executor.map(lambda write: _write_rendered_feature_list(*write), writes))
 
 
 if __name__ == "__main__":
@@ -20,7 +20,7 @@ Contains the dataclass-based in-memory representations of catalog components.
 from dataclasses import dataclass
 from typing import List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class Package:
     """Generic package entry from the catalog.
 
@@ -38,11 +38,11 @@ class Package:
     tag: str = ""
     sources: Optional[List[dict]] = None
 
-@dataclass
+@dataclass(slots=True)
 class FunctionalPackage(Package):
     """Package that belongs to the functional layer of the catalog."""
 
-@dataclass
+@dataclass(slots=True)
 class OsPackage(Package):
     """Package that belongs to the base OS layer of the catalog."""
 
@@ -50,6 +50,10 @@ class OsPackage(Package):
 class InfrastructurePackage:
     """Infrastructure package as described in the catalog."""
 
+    __slots__ = (
+        "id", "name", "version", "uri", "architecture", "config", "type", "sources", "tag",
+    )
+
     def __init__(self, id, name, version, uri, architecture, config, type, sources=None, tag=""):
         self.id = id
         self.name = name
@@ -65,6 +69,8 @@ class InfrastructurePackage:
 class Driver:
     """Driver package entry used by the drivers layer of the catalog."""
 
+    __slots__ = ("id", "name", "version", "uri", "architecture", "config", "type")
+
     def __init__(self, id, name, version, uri, architecture, config, type):
         self.id = id
         self.name = name
@@ -74,7 +80,7 @@ class Driver:
         self.config = config
         self.type = type
 
-@dataclass
+@dataclass(slots=True)
 class Catalog:
     """Top-level in-memory representation of the catalog JSON.
 
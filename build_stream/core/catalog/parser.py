@@ -18,12 +18,11 @@ Loads and validates a catalog JSON file against CatalogSchema.json and
 materializes it into model objects.
 """
 
-import json
 import logging
 import os
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 from .models import Catalog, FunctionalPackage, OsPackage, InfrastructurePackage, Driver
-from .utils import load_json_file
+from .utils import load_json_file, load_schema_validator, validate_with_validator
 
 logger = logging.getLogger(__name__)
 
@@ -42,12 +41,12 @@ def ParseCatalog(file_path: str, schema_path: str = _DEFAULT_SCHEMA_PATH) -> Cat
     """
 
     logger.info("Parsing catalog from %s using schema %s", file_path, schema_path)
-    schema = load_json_file(schema_path)
+    validator = load_schema_validator(schema_path)
     catalog_json = load_json_file(file_path)
 
     logger.debug("Validating catalog JSON against schema")
     try:
-        validate(instance=catalog_json, schema=schema)
+        validate_with_validator(catalog_json, validator)
     except ValidationError:
         logger.error(
             "Catalog validation failed for %s",
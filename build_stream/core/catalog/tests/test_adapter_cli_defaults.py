@@ -20,6 +20,8 @@ import unittest
 HERE = os.path.dirname(__file__)
 CATALOG_PARSER_DIR = os.path.dirname(HERE)
 PROJECT_ROOT = os.path.dirname(CATALOG_PARSER_DIR)
+SCHEMA_PATH = os.path.join(CATALOG_PARSER_DIR, "resources", "CatalogSchema.json")
+CATALOG_PATH = os.path.join(CATALOG_PARSER_DIR, "test_fixtures", "catalog_rhel.json")
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
@@ -28,17 +30,12 @@ from catalog_parser.adapter import generate_omnia_json_from_catalog, _DEFAULT_SC
 
 class TestAdapterDefaults(unittest.TestCase):
     def test_default_schema_path_points_to_resources(self):
-        catalog_parser_dir = os.path.dirname(os.path.dirname(__file__))
-        expected_schema = os.path.join(catalog_parser_dir, "resources", "CatalogSchema.json")
-        self.assertEqual(os.path.abspath(_DEFAULT_SCHEMA_PATH), os.path.abspath(expected_schema))
+        self.assertEqual(os.path.abspath(_DEFAULT_SCHEMA_PATH), os.path.abspath(SCHEMA_PATH))
 
     def test_generate_omnia_json_with_defaults_writes_output(self):
-        catalog_parser_dir = os.path.dirname(os.path.dirname(__file__))
-        catalog_path = os.path.join(catalog_parser_dir, "test_fixtures", "catalog_rhel.json")
-
         with tempfile.TemporaryDirectory() as tmpdir:
             generate_omnia_json_from_catalog(
-                catalog_path=catalog_path,
+                catalog_path=CATALOG_PATH,
                 output_root=tmpdir,
             )
 
@@ -14,11 +14,15 @@
 
 """Utility functions for the catalog parser package."""
 
-import json
 import logging
 import os
+from functools import lru_cache
 from typing import Any, Optional
 
+import orjson
+from jsonschema.exceptions import best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
 
 def _configure_logging(log_file: Optional[str] = None, log_level: int = logging.INFO) -> None:
     """Configure root logging.
@@ -66,7 +70,65 @@ def load_json_file(file_path: str) -> Any:
 
     Raises:
         FileNotFoundError: If the file does not exist.
-        json.JSONDecodeError: If the file contains invalid JSON.
+        json.JSONDecodeError: If the file contains invalid JSON or is not
+            valid UTF-8 (raised as its orjson.JSONDecodeError subclass).
     """
-    with open(file_path, "r", encoding="utf-8") as json_file:
-        return json.load(json_file)
+    with open(file_path, "rb") as json_file:
+        return orjson.loads(json_file.read())
+
+
+def get_schema_validator(schema: Any) -> Validator:
+    """Return a checked, compiled validator for a JSON schema.
+
+    Raises:
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    validator_cls = validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+@lru_cache(maxsize=16)
+def _load_schema_validator(schema_path: str, mtime_ns: int) -> Validator:
+    """Load and compile the schema at schema_path; mtime_ns keys the cache."""
+    return get_schema_validator(load_json_file(schema_path))
+
+
+def load_schema_validator(schema_path: str) -> Validator:
+    """Return the compiled validator for a JSON schema file.
+
+    Validators are cached by absolute path and modification time, so each
+    schema file is loaded, checked and compiled once until it changes.
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist.
+        json.JSONDecodeError: If the schema file is not valid JSON.
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    schema_path = os.path.abspath(schema_path)
+    return _load_schema_validator(schema_path, os.stat(schema_path).st_mtime_ns)
+
+
+def validate_against_schema(instance: Any, schema: Any) -> None:
+    """Validate instance against an in-memory schema.
+
+    Behaves like jsonschema.validate: the most relevant error is raised.
+
+    Raises:
+        jsonschema.ValidationError: If the instance is invalid.
+        jsonschema.SchemaError: If the schema itself is invalid.
+    """
+    validate_with_validator(instance, get_schema_validator(schema))
+
+
+def validate_with_validator(instance: Any, validator: Validator) -> None:
+    """Validate instance with an already compiled validator.
+
+    Behaves like jsonschema.validate: the most relevant error is raised.
+
+    Raises:
+        jsonschema.ValidationError: If the instance is invalid.
+    """
+    error = best_match(validator.iter_errors(instance))
+    if error is not None:
+        raise error
@@ -289,7 +289,9 @@ class InMemoryArtifactStore:
             for file_path in sorted(directory.rglob("*")):
                 if file_path.is_file():
                     rel_path = file_path.relative_to(directory)
-                    zf.writestr(str(rel_path), file_path.read_bytes())
+                    # Streams the file into the archive in chunks rather
+                    # than reading it whole into memory first.
+                    zf.write(file_path, arcname=str(rel_path))
         return buf.getvalue()
 
     def _validate_content_type(self, content_type: str) -> None:
@@ -29,7 +29,10 @@ from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from api.executor import shutdown_stage_executor
+from api.request_size_limit import MULTIPART_OVERHEAD_BYTES, RequestSizeLimitMiddleware
 from api.router import api_router
+from common.constants import MAX_CATALOG_SIZE_BYTES
 from container import container
 
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
@@ -54,7 +57,8 @@ logger.info("Using container: %s", container.__class__.__name__)
 async def lifespan(app: FastAPI):
     """Manage application lifecycle events.
     
-    Starts the result poller on startup and stops it on shutdown.
+    Starts the result poller on startup and stops it and the shared stage
+    executor on shutdown.
     """
     # Startup: Start the result poller
     result_poller = container.result_poller()
@@ -65,6 +69,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown: Stop the result poller
     await result_poller.stop()
+    shutdown_stage_executor()
     logger.info("Application shutdown complete")
 
 
@@ -81,6 +86,17 @@ app = FastAPI(
 # Attach container to app so dependency_injector Provide dependencies resolve
 app.container = container
 
+# Reject oversized uploads before they are spooled; the default allows the
+# largest accepted catalog plus multipart framing. Added before CORS so that
+# CORSMiddleware stays outermost and 413 responses carry CORS headers.
+DEFAULT_MAX_REQUEST_BODY_BYTES = MAX_CATALOG_SIZE_BYTES + MULTIPART_OVERHEAD_BYTES
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    max_body_size=int(
+        os.getenv("MAX_REQUEST_BODY_BYTES", str(DEFAULT_MAX_REQUEST_BODY_BYTES))
+    ),
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=os.getenv("CORS_ORIGINS", "*").split(","),
@@ -17,6 +17,7 @@
 from dataclasses import dataclass
 from typing import ClassVar
 
+from common.constants import MAX_CATALOG_SIZE_BYTES
 from core.jobs.value_objects import CorrelationId, JobId
 
 
@@ -37,7 +38,7 @@ class ParseCatalogCommand:
     content: bytes
 
     FILENAME_MAX_LENGTH: ClassVar[int] = 255
-    MAX_CONTENT_SIZE: ClassVar[int] = 5 * 1024 * 1024  # 5 MB
+    MAX_CONTENT_SIZE: ClassVar[int] = MAX_CATALOG_SIZE_BYTES
 
     def __post_init__(self) -> None:
         """Validate command fields."""
@@ -16,7 +16,6 @@
 
 """ParseCatalog use case implementation."""
 
-import json
 import logging
 import tempfile
 from datetime import datetime, timezone
@@ -25,6 +24,7 @@ from typing import Dict, Tuple
 
 import hashlib
 
+import orjson
 from jsonschema import ValidationError
 
 from core.artifacts.entities import ArtifactRecord
@@ -123,11 +123,9 @@ class ParseCatalogUseCase:  # pylint: disable=too-few-public-methods
         try:
             self._mark_stage_started(job, stage, command)
             self._validate_file_format(command.filename)
-            catalog_data = self._parse_and_validate_json(command.content)
+            self._parse_and_validate_json(command.content)
             catalog_ref = self._store_catalog_artifact(command)
-            root_jsons_ref = self._generate_and_store_root_jsons(
-                command, catalog_data
-            )
+            root_jsons_ref = self._generate_and_store_root_jsons(command)
             self._mark_stage_completed(stage, command)
             return self._build_success_result(
                 command, catalog_ref, root_jsons_ref
@@ -208,8 +206,8 @@ class ParseCatalogUseCase:  # pylint: disable=too-few-public-methods
     def _parse_and_validate_json(self, content: bytes) -> dict:
         """Parse JSON content from bytes and validate structure."""
         try:
-            data = json.loads(content.decode("utf-8"))
-        except json.JSONDecodeError as e:
+            data = orjson.loads(content.decode("utf-8"))
+        except orjson.JSONDecodeError as e:
             raise InvalidJSONError(f"Invalid JSON data: {e.msg}") from e
         except UnicodeDecodeError as e:
             raise InvalidJSONError("File content is not valid UTF-8 text") from e
@@ -268,17 +266,18 @@ class ParseCatalogUseCase:  # pylint: disable=too-few-public-methods
     def _generate_and_store_root_jsons(
         self,
         command: ParseCatalogCommand,
-        catalog_data: dict,
     ) -> Tuple[ArtifactRef, Dict[str, bytes]]:
-        """Generate root JSONs and store as ARCHIVE artifact."""
+        """Generate root JSONs and store as ARCHIVE artifact.
+
+        The validated upload bytes are written to disk unchanged for the
+        generator to read, instead of re-serializing the parsed document.
+        """
         with tempfile.TemporaryDirectory(
             prefix=f"parse-catalog-{command.job_id}-"
         ) as tmp_dir:
             tmp_path = Path(tmp_dir)
             catalog_file = tmp_path / "catalog.json"
-            catalog_file.write_text(
-                json.dumps(catalog_data), encoding="utf-8"
-            )
+            catalog_file.write_bytes(command.content)
 
             output_dir = tmp_path / "root_jsons"
             output_dir.mkdir()
@@ -30,6 +30,17 @@ from core.catalog.adapter import generate_omnia_json_from_catalog, _DEFAULT_SCHE
 pytestmark = pytest.mark.skip(reason="Test file marked to be ignored")
 
 
+def _has_json_file(path):
+    """Return True as soon as any .json file is found under path."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(".json"):
+                return True
+            if entry.is_dir() and _has_json_file(entry.path):
+                return True
+    return False
+
+
 class TestAdapterDefaults(unittest.TestCase):
     def test_default_schema_path_points_to_resources(self):
         # The default schema path should point to the actual resources directory in core/catalog
@@ -53,13 +64,10 @@ class TestAdapterDefaults(unittest.TestCase):
             )
 
             # We expect some JSON files under arch/os/version
-            found_any_json = False
-            for root, dirs, files in os.walk(tmpdir):
-                if any(f.endswith('.json') for f in files):
-                    found_any_json = True
-                    break
-
-            self.assertTrue(found_any_json, "No JSON configs generated under any arch/os/version")
+            self.assertTrue(
+                _has_json_file(tmpdir),
+                "No JSON configs generated under any arch/os/version",
+            )
 
 
 if __name__ == "__main__":
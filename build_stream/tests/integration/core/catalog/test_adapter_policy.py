@@ -41,6 +41,7 @@ from core.catalog.adapter_policy import (
     derive_common_role,
     check_conditions,
     process_target_spec,
+    _index_targets_by_partition,
     write_config_file,
     generate_configs_from_policy,
     _DEFAULT_POLICY_PATH,
@@ -460,6 +461,35 @@ class TestAllowlistAndFieldFilters(unittest.TestCase):
             ["openldap-clients", "vendor-ldap", "slapd-utils"],
         )
 
+    def test_any_of_keeps_input_order_without_duplicates(self):
+        packages = [
+            {"package": "slapd-utils"},
+            {"package": "openldap-clients"},
+            {"package": "openldap-slapd"},
+        ]
+
+        filter_config = {
+            schema.TYPE: schema.ANY_OF_FILTER,
+            schema.FILTERS: [
+                {
+                    schema.TYPE: schema.ALLOWLIST_FILTER,
+                    schema.FIELD: "package",
+                    schema.VALUES: ["openldap-clients", "openldap-slapd"],
+                },
+                {
+                    schema.TYPE: schema.SUBSTRING_FILTER,
+                    schema.FIELD: "package",
+                    schema.VALUES: ["slapd"],
+                },
+            ],
+        }
+
+        result = apply_filter(packages, {}, "Base OS", filter_config)
+        self.assertEqual(
+            [p["package"] for p in result],
+            ["slapd-utils", "openldap-clients", "openldap-slapd"],
+        )
+
 
 class TestComputeCommonPackages(unittest.TestCase):
     """Tests for compute_common_packages function."""
@@ -555,6 +585,40 @@ class TestCheckConditions(unittest.TestCase):
         self.assertFalse(check_conditions(conditions, "aarch64", "rhel", "9.0"))
 
 
+class TestIndexTargetsByPartition(unittest.TestCase):
+    """Tests for _index_targets_by_partition function."""
+
+    def test_registers_targets_only_under_matching_partitions(self):
+        """Each partition gets the targets check_conditions accepts, in policy order."""
+        partitions = [
+            ("x86_64", "rhel", "9.0"),
+            ("aarch64", "rhel", "9.0"),
+            ("x86_64", "ubuntu", "22.04"),
+        ]
+        targets = {
+            "all.json": {},
+            "x86.json": {"conditions": {schema.ARCHITECTURES: ["x86_64"]}},
+            "rhel_arm.json": {
+                "conditions": {
+                    schema.ARCHITECTURES: ["aarch64"],
+                    schema.OS_FAMILIES: ["rhel"],
+                }
+            },
+            "unknown_arch.json": {"conditions": {schema.ARCHITECTURES: ["ppc64le"]}},
+        }
+
+        index = _index_targets_by_partition(targets, partitions)
+
+        self.assertEqual(list(index[("x86_64", "rhel", "9.0")]), ["all.json", "x86.json"])
+        self.assertEqual(list(index[("aarch64", "rhel", "9.0")]), ["all.json", "rhel_arm.json"])
+        self.assertEqual(list(index[("x86_64", "ubuntu", "22.04")]), ["all.json", "x86.json"])
+        for partition in partitions:
+            expected = [
+                name for name, spec in targets.items()
+                if check_conditions(spec.get("conditions"), *partition)
+            ]
+            self.assertEqual(list(index[partition]), expected)
+
 class TestDeriveCommonRole(unittest.TestCase):
     """Tests for derive_common_role function."""
 
@@ -25,9 +25,12 @@ if PROJECT_ROOT not in sys.path:
 
 from core.catalog.generator import (
     FeatureList,
+    deserialize_json,
+    deserialize_json_data,
     serialize_json,
     get_functional_layer_roles_from_file,
 )
+from core.catalog.utils import load_json_file
 
 
 class TestGetFunctionalLayerRolesFromFile(unittest.TestCase):
@@ -83,5 +86,55 @@ class TestGetFunctionalLayerRolesFromFile(unittest.TestCase):
                 get_functional_layer_roles_from_file(json_path)
 
 
+class TestDeserializeJsonData(unittest.TestCase):
+    def test_matches_deserialize_json_for_fixture(self):
+        fixture_path = os.path.join(
+            PROJECT_ROOT, "core", "catalog", "test_fixtures", "functional_layer.json"
+        )
+
+        from_data = deserialize_json_data(load_json_file(fixture_path))
+
+        self.assertEqual(from_data, deserialize_json(fixture_path))
+
+
+class TestSerializeJsonSkipsUnchanged(unittest.TestCase):
+    def test_unchanged_output_is_not_rewritten(self):
+        fixture_path = os.path.join(
+            PROJECT_ROOT, "core", "catalog", "test_fixtures", "functional_layer.json"
+        )
+        feature_list = deserialize_json(fixture_path)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, "functional_layer.json")
+            serialize_json(feature_list, out_path)
+            os.utime(out_path, (0, 0))
+
+            serialize_json(feature_list, out_path)
+            self.assertEqual(os.stat(out_path).st_mtime, 0)
+
+            with open(out_path, "w", encoding="utf-8") as f:
+                f.write("{}")
+            serialize_json(feature_list, out_path)
+            self.assertEqual(deserialize_json(out_path), feature_list)
+
+    def test_crlf_output_is_rewritten_with_lf(self):
+        fixture_path = os.path.join(
+            PROJECT_ROOT, "core", "catalog", "test_fixtures", "functional_layer.json"
+        )
+        feature_list = deserialize_json(fixture_path)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, "functional_layer.json")
+            serialize_json(feature_list, out_path)
+            with open(out_path, "rb") as f:
+                lf_bytes = f.read()
+            with open(out_path, "wb") as f:
+                f.write(lf_bytes.replace(b"\n", b"\r\n"))
+
+            serialize_json(feature_list, out_path)
+            with open(out_path, "rb") as f:
+                self.assertEqual(f.read(), lf_bytes)
+
+
 if __name__ == "__main__":
     unittest.main()
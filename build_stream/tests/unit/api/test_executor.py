@@ -0,0 +1,52 @@
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the shared stage executor."""
+
+import threading
+
+import pytest
+
+from api.executor import get_stage_executor, run_stage_task, shutdown_stage_executor
+
+
+class TestStageExecutor:
+    """Tests for the shared stage executor helpers."""
+
+    def teardown_method(self):
+        """Release the executor created by each test."""
+        shutdown_stage_executor()
+
+    def test_executor_is_shared(self):
+        """Repeated lookups should return the same executor."""
+        assert get_stage_executor() is get_stage_executor()
+
+    def test_shutdown_recreates_executor_on_next_use(self):
+        """A new executor should be created after shutdown."""
+        first = get_stage_executor()
+        shutdown_stage_executor()
+
+        assert get_stage_executor() is not first
+
+    @pytest.mark.asyncio
+    async def test_run_stage_task_runs_off_event_loop_thread(self):
+        """Tasks should run on a worker thread and return their result."""
+        def work(value, suffix=""):
+            return value + suffix, threading.current_thread().name
+
+        result, thread_name = await run_stage_task(work, "done", suffix="!")
+
+        assert result == "done!"
+        assert thread_name.startswith("stage-worker")
+        assert thread_name != threading.current_thread().name
@@ -0,0 +1,70 @@
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the request size limit middleware."""
+
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from api.request_size_limit import RequestSizeLimitMiddleware
+
+
+def _make_client(max_body_size: int) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(RequestSizeLimitMiddleware, max_body_size=max_body_size)
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)) -> dict:
+        return {"size": len(await file.read())}
+
+    return TestClient(app)
+
+
+class TestRequestSizeLimitMiddleware:
+    """Tests for RequestSizeLimitMiddleware."""
+
+    def test_request_within_limit_is_passed_through(self):
+        """Bodies under the limit should reach the route."""
+        client = _make_client(max_body_size=1024)
+
+        response = client.post("/upload", files={"file": ("a.json", b"{}")})
+
+        assert response.status_code == 200
+        assert response.json() == {"size": 2}
+
+    def test_content_length_over_limit_returns_413(self):
+        """A declared Content-Length over the limit should be rejected."""
+        client = _make_client(max_body_size=1024)
+
+        response = client.post("/upload", files={"file": ("a.json", b"x" * 4096)})
+
+        assert response.status_code == 413
+        assert response.json()["detail"]["error_code"] == "REQUEST_TOO_LARGE"
+
+    def test_streamed_body_over_limit_returns_413(self):
+        """A body without Content-Length should be cut off once it crosses the limit."""
+        client = _make_client(max_body_size=1024)
+
+        def chunks():
+            for _ in range(8):
+                yield b"x" * 512
+
+        response = client.post(
+            "/upload",
+            content=chunks(),
+            headers={"Content-Type": "multipart/form-data; boundary=b"},
+        )
+
+        assert response.status_code == 413
+        assert response.json()["detail"]["error_code"] == "REQUEST_TOO_LARGE"
@@ -24,6 +24,7 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from core.catalog.parser import ParseCatalog, _DEFAULT_SCHEMA_PATH
+from core.catalog.utils import get_schema_validator
 
 
 class TestParseCatalog:
@@ -61,7 +62,8 @@ class TestParseCatalog:
             # Mock the schema loading to avoid dependency on actual schema file
             mock_schema = {"type": "object", "properties": {"Catalog": {"type": "object"}}}
             
-            with patch('core.catalog.parser.load_json_file') as mock_load:
+            with patch('core.catalog.parser.load_json_file') as mock_load, \
+                    patch('core.catalog.parser.load_schema_validator') as mock_load_validator:
                 # Configure mock to return schema for schema_path and catalog data for catalog_path
                 def load_side_effect(path):
                     if path == _DEFAULT_SCHEMA_PATH:
@@ -72,6 +74,7 @@ class TestParseCatalog:
                         raise FileNotFoundError(f"Unexpected path: {path}")
                 
                 mock_load.side_effect = load_side_effect
+                mock_load_validator.side_effect = lambda path: get_schema_validator(load_side_effect(path))
                 
                 result = ParseCatalog(catalog_path)
                 
@@ -105,7 +108,8 @@ class TestParseCatalog:
         mock_schema = {"type": "object", "properties": {"Catalog": {"type": "object"}}}
 
         try:
-            with patch('core.catalog.parser.load_json_file') as mock_load:
+            with patch('core.catalog.parser.load_json_file') as mock_load, \
+                    patch('core.catalog.parser.load_schema_validator') as mock_load_validator:
                 def load_side_effect(path):
                     if path == custom_schema_path:
                         return mock_schema
@@ -115,6 +119,7 @@ class TestParseCatalog:
                         raise FileNotFoundError(f"Unexpected path: {path}")
                 
                 mock_load.side_effect = load_side_effect
+                mock_load_validator.side_effect = lambda path: get_schema_validator(load_side_effect(path))
                 
                 result = ParseCatalog(catalog_path, custom_schema_path)
                 
@@ -152,7 +157,8 @@ class TestParseCatalog:
         }
 
         try:
-            with patch('core.catalog.parser.load_json_file') as mock_load:
+            with patch('core.catalog.parser.load_json_file') as mock_load, \
+                    patch('core.catalog.parser.load_schema_validator') as mock_load_validator:
                 def load_side_effect(path):
                     if path == _DEFAULT_SCHEMA_PATH:
                         return mock_schema
@@ -162,6 +168,7 @@ class TestParseCatalog:
                         raise FileNotFoundError(f"Unexpected path: {path}")
                 
                 mock_load.side_effect = load_side_effect
+                mock_load_validator.side_effect = lambda path: get_schema_validator(load_side_effect(path))
                 
                 with pytest.raises(ValidationError):
                     ParseCatalog(catalog_path)
@@ -234,7 +241,8 @@ class TestParseCatalog:
         mock_schema = {"type": "object", "properties": {"Catalog": {"type": "object"}}}
 
         try:
-            with patch('core.catalog.parser.load_json_file') as mock_load:
+            with patch('core.catalog.parser.load_json_file') as mock_load, \
+                    patch('core.catalog.parser.load_schema_validator') as mock_load_validator:
                 def load_side_effect(path):
                     if path == _DEFAULT_SCHEMA_PATH:
                         return mock_schema
@@ -244,6 +252,7 @@ class TestParseCatalog:
                         raise FileNotFoundError(f"Unexpected path: {path}")
                 
                 mock_load.side_effect = load_side_effect
+                mock_load_validator.side_effect = lambda path: get_schema_validator(load_side_effect(path))
                 
                 result = ParseCatalog(catalog_path)
                 
@@ -276,7 +285,8 @@ class TestParseCatalog:
         mock_schema = {"type": "object", "properties": {"Catalog": {"type": "object"}}}
 
         try:
-            with patch('core.catalog.parser.load_json_file') as mock_load:
+            with patch('core.catalog.parser.load_json_file') as mock_load, \
+                    patch('core.catalog.parser.load_schema_validator') as mock_load_validator:
                 def load_side_effect(path):
                     if path == _DEFAULT_SCHEMA_PATH:
                         return mock_schema
@@ -286,6 +296,7 @@ class TestParseCatalog:
                         raise FileNotFoundError(f"Unexpected path: {path}")
                 
                 mock_load.side_effect = load_side_effect
+                mock_load_validator.side_effect = lambda path: get_schema_validator(load_side_effect(path))
                 
                 result = ParseCatalog(catalog_path)
                 
@@ -0,0 +1,107 @@
+# Copyright 2026 Dell Inc. or its subsidiaries. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for catalog utility helpers."""
+
+import json
+import os
+
+import pytest
+from jsonschema import SchemaError, ValidationError
+
+from core.catalog.utils import (
+    get_schema_validator,
+    load_schema_validator,
+    validate_against_schema,
+    validate_with_validator,
+)
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"name": {"type": "string"}},
+    "required": ["name"],
+}
+
+
+class TestGetSchemaValidator:
+    """Tests for get_schema_validator function."""
+
+    def test_returns_validator_for_schema(self) -> None:
+        """The returned validator should enforce the given schema."""
+        validator = get_schema_validator(SCHEMA)
+
+        assert validator.is_valid({"name": "catalog"})
+        assert not validator.is_valid({"name": 1})
+
+    def test_invalid_schema_raises_schema_error(self) -> None:
+        """An invalid schema should be rejected."""
+        with pytest.raises(SchemaError):
+            get_schema_validator({"type": 12})
+
+
+class TestLoadSchemaValidator:
+    """Tests for load_schema_validator function."""
+
+    def test_same_file_returns_cached_validator(self, tmp_path) -> None:
+        """Repeated loads of an unchanged schema file share one validator."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps(SCHEMA), encoding="utf-8")
+
+        assert load_schema_validator(str(schema_path)) is load_schema_validator(str(schema_path))
+
+    def test_modified_file_returns_new_validator(self, tmp_path) -> None:
+        """Rewriting the schema file should invalidate the cached validator."""
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps(SCHEMA), encoding="utf-8")
+        first = load_schema_validator(str(schema_path))
+
+        schema_path.write_text(json.dumps({**SCHEMA, "required": []}), encoding="utf-8")
+        mtime_ns = os.stat(schema_path).st_mtime_ns + 1_000_000
+        os.utime(schema_path, ns=(mtime_ns, mtime_ns))
+        second = load_schema_validator(str(schema_path))
+
+        assert second is not first
+        assert second.is_valid({})
+
+    def test_missing_file_raises_file_not_found(self, tmp_path) -> None:
+        """A missing schema file should raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_schema_validator(str(tmp_path / "missing.json"))
+
+
+class TestValidateAgainstSchema:
+    """Tests for validate_against_schema function."""
+
+    def test_valid_instance_passes(self) -> None:
+        """A conforming instance should validate without error."""
+        validate_against_schema({"name": "catalog"}, SCHEMA)
+
+    def test_invalid_instance_raises_validation_error(self) -> None:
+        """A non-conforming instance should raise ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_against_schema({"name": 1}, SCHEMA)
+
+
+class TestValidateWithValidator:
+    """Tests for validate_with_validator function."""
+
+    def test_valid_instance_passes(self) -> None:
+        """A conforming instance should validate without error."""
+        validate_with_validator({"name": "catalog"}, get_schema_validator(SCHEMA))
+
+    def test_invalid_instance_raises_validation_error(self) -> None:
+        """A non-conforming instance should raise ValidationError."""
+        with pytest.raises(ValidationError):
+            validate_with_validator({"name": 1}, get_schema_validator(SCHEMA))
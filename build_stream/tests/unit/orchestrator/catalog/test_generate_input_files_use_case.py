@@ -17,7 +17,7 @@
 import json
 import os
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -142,6 +142,16 @@ def _seed_upstream_artifacts(
     return ref
 
 
+def _patch_load_config(tmp_path):
+    """Patch the use case's load_config so copied configs land under tmp_path."""
+    config = MagicMock()
+    config.file_store.base_path = str(tmp_path / "artifacts")
+    return patch(
+        "orchestrator.catalog.use_cases.generate_input_files.load_config",
+        return_value=config,
+    )
+
+
 class TestStageGuards:
     """Tests for stage guard validation."""
 
@@ -332,7 +342,7 @@ class TestHappyPath:
                 "orchestrator.catalog.use_cases.generate_input_files"
                 ".generate_configs_from_policy",
                 side_effect=mock_generate,
-            ), patch('orchestrator.catalog.use_cases.generate_input_files.load_config'), patch.object(uc, '_mark_stage_failed'):
+            ), _patch_load_config(tmp_path), patch.object(uc, '_mark_stage_failed'):
                 result = uc.execute(_make_command())
 
         assert result.stage_state == "COMPLETED"
@@ -456,7 +466,7 @@ class TestHappyPath:
             "orchestrator.catalog.use_cases.generate_input_files"
             ".generate_configs_from_policy",
             side_effect=mock_generate,
-        ), patch('orchestrator.catalog.use_cases.generate_input_files.load_config'), patch.object(uc, '_mark_stage_failed'):
+        ), _patch_load_config(tmp_path), patch.object(uc, '_mark_stage_failed'):
             uc.execute(_make_command())
 
         events = audit_repo.find_by_job(JobId(VALID_JOB_ID))
@@ -536,7 +546,7 @@ class TestIdempotency:
             "orchestrator.catalog.use_cases.generate_input_files"
             ".generate_configs_from_policy",
             side_effect=mock_generate,
-        ), patch('orchestrator.catalog.use_cases.generate_input_files.load_config'):
+        ), _patch_load_config(tmp_path):
             result = uc.execute(_make_command())
 
         # Should succeed and return the existing artifact